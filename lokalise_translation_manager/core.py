@@ -9,7 +9,7 @@ results back to Lokalise.
 Workflow Steps:
     0. Download existing translations from Lokalise
     1. Scan iOS project for localization keys
-    2. Scan Android project for localization keys
+    2. Scan Android project for localization keys (alongside step 1)
     3. Merge missing translations from both platforms
     4. Download all Lokalise keys metadata
     5. Normalize translation data
@@ -42,11 +42,13 @@ Version: 1.0.0
 
 import importlib
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import importlib.util
 from typing import List, Optional
 from lokalise_translation_manager.utils.plugin_manager import (
     get_enabled_plugins_by_type,
+    get_enabled_plugins_grouped,
     sync_plugin_config,
     print_plugin_status
 )
@@ -348,6 +350,7 @@ def run_tool() -> None:
         0. Download existing translations from Lokalise
         1. Scan iOS project for NSLocalizedString() calls
         2. Scan Android project for R.string.* and @string/* references
+           (steps 1 and 2 run concurrently)
         3. Merge missing translations from both platforms
         4. Download all Lokalise keys for metadata enrichment
         5. Normalize translation data (consistent format)
@@ -419,22 +422,21 @@ def run_tool() -> None:
         download_module.main()
 
         # ===================================================================
-        # STEP 1: Scan iOS Project
+        # STEPS 1-2: Scan iOS and Android Projects
         # ===================================================================
-        print_colored("\nRunning iOS scanner...", Fore.CYAN)
+        # The scanners read disjoint project trees and write their own
+        # reports, so they run side by side; their output may interleave.
+        print_colored("\nRunning iOS and Android scanners...", Fore.CYAN)
         ios_scanner = importlib.import_module(
             "lokalise_translation_manager.scanner.ios_scanner"
         )
-        ios_scanner.main()
-
-        # ===================================================================
-        # STEP 2: Scan Android Project
-        # ===================================================================
-        print_colored("\nRunning Android scanner...", Fore.CYAN)
         android_scanner = importlib.import_module(
             "lokalise_translation_manager.scanner.android_scanner"
         )
-        android_scanner.main()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            scans = [executor.submit(ios_scanner.main), executor.submit(android_scanner.main)]
+        for scan in scans:
+            scan.result()  # Re-raise a scanner error, iOS first
 
         # ===================================================================
         # STEP 3: Merge Platform Results
@@ -484,8 +486,9 @@ def run_tool() -> None:
         # ===================================================================
         # STEP 7: Translation (with Plugin Support)
         # ===================================================================
-        # Generic plugin discovery - check if ACTION plugins exist
-        action_plugins = discover_action_plugins()
+        # Generic plugin discovery - one lookup serves both plugin types
+        enabled_plugins = get_enabled_plugins_grouped()
+        action_plugins = enabled_plugins["ACTION"]
         skip_translation = False
 
         if action_plugins:
@@ -539,7 +542,7 @@ def run_tool() -> None:
                 "\nChecking for EXTENSION plugins to run on existing translations...",
                 Fore.CYAN
             )
-            extension_plugins = discover_extension_plugins()
+            extension_plugins = enabled_plugins["EXTENSION"]
 
             if extension_plugins:
                 print_colored(
@@ -0,0 +1,169 @@
+"""
+Source file scanning shared by the iOS and Android scanners
+
+Walks a project tree, finds the localization keys referenced in its source
+files and collects them, in-process or in a process pool depending on the
+size of the project. Each scanner supplies its file suffixes and key
+patterns (see scan_source_files()); everything else is the same for both
+platforms.
+
+Process pool workers are started with 'spawn' and import this module, not
+the scanners, so they stay light. Spawn also re-imports the entry script,
+which is why run.py keeps all of its work under `if __name__ == "__main__"`.
+"""
+
+import mmap
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+
+# ==================== SCAN CONFIGURATION ====================
+
+SCAN_WORKERS = os.cpu_count() or 1  # Processes scanning source files in parallel
+SCAN_CHUNKSIZE = 32  # Files handed to a worker at a time
+PARALLEL_SCAN_MIN_FILES = 5000  # Below this, worker start-up outweighs the gain
+READ_WORKERS = 16  # Threads overlapping file reads below that threshold
+MMAP_MIN_BYTES = 1 << 20  # Larger files are memory-mapped instead of read
+PROGRESS_INTERVAL = 128  # Files between progress updates on a terminal
+
+# (suffixes, pattern) pairs: files ending in one of the suffixes are searched
+# with the pattern, a bytes regex whose first group captures the key
+KeyPatterns = Tuple[Tuple[Tuple[str, ...], re.Pattern], ...]
+
+# ==================== SCANNING ====================
+
+def iter_source_files(directory: str, suffixes: Tuple[str, ...]) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (path, relative_path) for every file under `directory` ending in `suffixes`.
+
+    An explicit os.scandir() walk: DirEntry caches the file type from the
+    directory listing, and the relative path is built alongside the full
+    one instead of with os.path.relpath(). Visits files in the same order
+    as os.walk() and, like it, does not descend into symlinked directories
+    and skips directories it cannot list.
+    """
+    stack = [(directory, '')]
+    while stack:
+        path, relative = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append((entry.path, relative + entry.name + os.sep))
+                    elif entry.name.endswith(suffixes):
+                        yield entry.path, relative + entry.name
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def scan_file(file_path: str, patterns: KeyPatterns) -> Tuple[Optional[Set[str]], int, Optional[str]]:
+    """
+    Return the keys referenced in one source file.
+
+    Module-level so that it can run in ProcessPoolExecutor workers.
+
+    Args:
+        file_path: File to scan; the first entry of `patterns` whose
+                   suffixes it ends with selects the pattern
+        patterns: See KeyPatterns
+
+    Returns:
+        Tuple: (keys, count, error). keys holds the distinct keys and count
+        the number of references; keys is None and error holds the message
+        if the file could not be read.
+
+    Note:
+        - Matches are streamed with finditer() into a set, so no list of
+          every match is built and workers send back each key once
+        - Files are scanned as bytes and only the captured keys are
+          decoded; files of MMAP_MIN_BYTES or more are memory-mapped
+    """
+    pattern = next(pattern for suffixes, pattern in patterns if file_path.endswith(suffixes))
+    try:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    return _collect_keys(pattern, content)
+            return _collect_keys(pattern, f.read())
+    except Exception as e:
+        return None, 0, str(e)
+
+
+def _collect_keys(pattern: re.Pattern, content) -> Tuple[Set[str], int, None]:
+    """Return scan_file()'s result for the bytes (or mmap) `content`."""
+    keys = set()
+    count = 0
+    for match in pattern.finditer(content):
+        keys.add(match.group(1).decode('utf-8'))
+        count += 1
+    return keys, count, None
+
+
+def scan_source_files(
+    directory: str,
+    patterns: KeyPatterns,
+    label: str,
+    on_error: Callable[[str], None]
+) -> Tuple[Set[str], Dict[str, int]]:
+    """
+    Collect the keys referenced by the source files under `directory`.
+
+    Args:
+        directory: Root directory of the project to scan
+        patterns: Which files to scan and how (see KeyPatterns)
+        label: What the files are called in progress output (e.g. "Swift files")
+        on_error: Called with a message for every file that cannot be read
+
+    Returns:
+        Tuple[Set[str], Dict[str, int]]: Every distinct key, and the number of
+        references in each readable file by path relative to `directory`
+
+    Performance:
+        Projects with at least PARALLEL_SCAN_MIN_FILES files are scanned by
+        SCAN_WORKERS processes; smaller ones in-process, where starting the
+        workers would cost more than it saves. In-process scans use
+        READ_WORKERS threads so that file reads, which release the GIL,
+        overlap each other and the regex matching. On a terminal, progress
+        is shown every PROGRESS_INTERVAL files.
+    """
+    keys = set()
+    file_analysis = {}
+
+    suffixes = tuple(suffix for file_suffixes, _ in patterns for suffix in file_suffixes)
+    source_files = list(iter_source_files(directory, suffixes))
+    file_paths = [path for path, _ in source_files]
+    scan = partial(scan_file, patterns=patterns)
+
+    def record(results) -> None:
+        # Progress is only drawn on a terminal, where \r rewrites the line
+        show_progress = sys.stdout.isatty() and len(source_files) >= PROGRESS_INTERVAL
+        for scanned, ((file_path, relative_path), (file_keys, count, error)) in enumerate(
+                zip(source_files, results), 1):
+            if show_progress and scanned % PROGRESS_INTERVAL == 0:
+                print(f"\rScanned {scanned}/{len(source_files)} {label}...", end='', flush=True)
+            if error is not None:
+                on_error(f"Error reading {file_path}: {error}")
+                continue
+            keys.update(file_keys)
+            file_analysis[relative_path] = count
+        if show_progress:
+            print()
+
+    if SCAN_WORKERS > 1 and len(file_paths) >= PARALLEL_SCAN_MIN_FILES:
+        # spawn: this may run on a worker thread (see core.run_tool), and
+        # forking a multi-threaded process is unsafe
+        with ProcessPoolExecutor(max_workers=SCAN_WORKERS,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            record(executor.map(scan, file_paths, chunksize=SCAN_CHUNKSIZE))
+    else:
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+            record(executor.map(scan, file_paths))
+
+    return keys, file_analysis
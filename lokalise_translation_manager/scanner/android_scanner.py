@@ -117,7 +117,7 @@ excluded_locales = en, base
 DEPENDENCIES:
 -------------
 Required:
-- Standard library: os, re, csv, time, threading, json, pathlib, configparser
+- Standard library: os, re, csv, sys, time, json, pathlib, configparser
 
 Optional (graceful fallback):
 - colorama: Colored console output
@@ -138,7 +138,7 @@ Via core workflow:
 EXAMPLE OUTPUT:
 ---------------
 When run, displays:
-    | Loading... (animated spinner)
+    Scanned 1024/1536 source files... (progress, interactive terminals only)
 
     Results have been written to final_result_android.csv
     Total keys have been written to total_keys_used_android.csv
@@ -176,7 +176,6 @@ PERFORMANCE:
 ------------
 - Scans ~200 Kotlin/Java/XML files in ~1-2 seconds
 - Memory efficient: streaming file processing
-- Thread-safe: Uses daemon thread for spinner animation
 
 AUTHORS:
 --------
@@ -188,12 +187,15 @@ import os
 import re
 import csv
 import time
-import threading
 import json
+import shutil
 from pathlib import Path
 from typing import Set, Dict, Tuple
 import configparser
 
+from ..utils.csv_utils import CSV_BUFFER_SIZE
+from ._scan_common import scan_source_files
+
 # Optional colorama support for colored console output
 try:
     from colorama import Fore, Style, init
@@ -210,6 +212,15 @@ except ImportError:
     class Style:
         RESET_ALL = ''
 
+# Streaming XML parser for strings files: lxml when installed, else the
+# standard library's C-accelerated ElementTree (same iterparse() API)
+try:
+    from lxml import etree
+    XMLParseError = etree.XMLSyntaxError
+except ImportError:
+    import xml.etree.ElementTree as etree
+    XMLParseError = etree.ParseError
+
 # Optional prettytable support for formatted output
 try:
     from prettytable import PrettyTable
@@ -227,6 +238,17 @@ FINAL_RESULT_CSV = REPORTS_DIR / "final_result_android.csv"
 TOTAL_KEYS_CSV = REPORTS_DIR / "total_keys_used_android.csv"
 MISSING_TRANSLATIONS_CSV = REPORTS_DIR / "missing_android_translations.csv"
 
+# ==================== SCAN CONFIGURATION ====================
+
+CODE_KEY_PATTERN = re.compile(rb'R\.string\.([a-zA-Z0-9_]+)')  # For Kotlin/Java
+XML_KEY_PATTERN = re.compile(rb'@string/([a-zA-Z0-9_]+)')     # For XML
+# Source files scanned for keys, and the pattern used for each
+KEY_PATTERNS = ((('.kt', '.java'), CODE_KEY_PATTERN), (('.xml',), XML_KEY_PATTERN))
+# <string> entries in strings.xml; DOTALL lets values span lines
+STRING_ENTRY_PATTERN = re.compile(r'<string name=\"([^\"]+)\">(.*?)</string>', re.DOTALL)
+# Strings files of a values directory; later ones override earlier ones
+STRINGS_FILE_NAMES = ("strings.xml", "Lokalizable.xml")
+
 # ==================== UTILITY FUNCTIONS ====================
 
 def print_colored(text: str, color: str) -> None:
@@ -249,37 +271,6 @@ def print_colored(text: str, color: str) -> None:
     print(color + text if color_enabled else text)
 
 
-def spinner() -> None:
-    """
-    Display animated loading spinner in terminal.
-
-    Shows a rotating cursor animation (|/-\\) while scanning is in progress.
-    Runs in a daemon thread and automatically stops when global stop_loading
-    flag is set to True.
-
-    This provides visual feedback during long-running scan operations without
-    blocking the main thread.
-
-    Global Variables:
-        stop_loading: Boolean flag to stop the spinner animation
-
-    Note:
-        This function is designed to run in a daemon thread. It will
-        automatically terminate when the main program exits.
-
-    Example:
-        global stop_loading
-        stop_loading = False
-        threading.Thread(target=spinner, daemon=True).start()
-        # ... perform scanning ...
-        stop_loading = True
-    """
-    while not stop_loading:
-        for cursor in '|/-\\':
-            print('\r' + cursor + ' Loading...', end='', flush=True)
-            time.sleep(0.1)
-
-
 # ==================== CORE SCANNING FUNCTIONS ====================
 
 def extract_localized_strings(directory: str) -> Tuple[Set[str], Dict[str, int]]:
@@ -329,6 +320,11 @@ def extract_localized_strings(directory: str) -> Tuple[Set[str], Dict[str, int]]
         The function tracks per-file statistics including files with zero
         references (useful for identifying unused layout files).
 
+    Performance:
+        Files are scanned by _scan_common.scan_source_files(): in a process
+        pool for projects with at least PARALLEL_SCAN_MIN_FILES source files,
+        otherwise in-process with threads overlapping the file reads.
+
     Error Handling:
         - Unreadable files: Logs error and continues with remaining files
         - CSV write errors: Logs error but doesn't stop execution
@@ -348,55 +344,26 @@ def extract_localized_strings(directory: str) -> Tuple[Set[str], Dict[str, int]]
         # Total files: 156
         # Most used file: app/src/main/java/MainActivity.kt (45 keys)
     """
-    localized_strings = set()
-    file_analysis = {}
-
-    # Regex patterns for different file types
-    pattern_code = re.compile(r'R\.string\.([a-zA-Z0-9_]+)')  # For Kotlin/Java
-    pattern_xml = re.compile(r'@string/([a-zA-Z0-9_]+)')      # For XML
-
-    # Recursively walk through all files in directory
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(('.kt', '.java', '.xml')):
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, directory)
-
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        matches = []
-
-                        # Use appropriate pattern based on file type
-                        if file.endswith(('.kt', '.java')):
-                            matches = pattern_code.findall(content)
-                        elif file.endswith('.xml'):
-                            matches = pattern_xml.findall(content)
-
-                        localized_strings.update(matches)
-                        file_analysis[relative_path] = len(matches)
-                except Exception as e:
-                    print_colored(f"Error reading {file_path}: {e}", Fore.RED)
+    localized_strings, file_analysis = scan_source_files(
+        directory, KEY_PATTERNS, "source files", lambda message: print_colored(message, Fore.RED)
+    )
 
     # Create reports directory if it doesn't exist
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Write final_result_android.csv: All unique keys
     try:
-        with FINAL_RESULT_CSV.open('w', newline='', encoding='utf-8') as csv_file:
+        with FINAL_RESULT_CSV.open('w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csv_file:
             writer = csv.writer(csv_file)
-            for string in sorted(localized_strings):
-                writer.writerow([string])
+            writer.writerows((string,) for string in sorted(localized_strings))
         print_colored("\nResults have been written to final_result_android.csv", Fore.CYAN)
     except Exception as e:
         print_colored(f"Error writing to final_result_android.csv: {e}", Fore.RED)
 
-    # Write total_keys_used_android.csv: Same as above (legacy compatibility)
+    # Write total_keys_used_android.csv: Same as above (legacy compatibility),
+    # copied rather than sorted and written again
     try:
-        with TOTAL_KEYS_CSV.open('w', newline='', encoding='utf-8') as csv_file:
-            writer = csv.writer(csv_file)
-            for string in sorted(localized_strings):
-                writer.writerow([string])
+        shutil.copyfile(FINAL_RESULT_CSV, TOTAL_KEYS_CSV)
         print_colored("\nTotal keys have been written to total_keys_used_android.csv", Fore.CYAN)
     except Exception as e:
         print_colored(f"Error writing to total_keys_used_android.csv: {e}", Fore.RED)
@@ -433,11 +400,14 @@ def load_strings_file(file_path: str) -> Dict[str, bool]:
             </resources>
 
     Parsing Logic:
-        Uses regex to extract <string> tags with name attributes:
-        - Pattern: <string name="([^"]+)">(.*?)</string>
-        - Uses re.DOTALL to match multi-line string values
-        - Strips whitespace from values
+        Streams the file with iterparse() (lxml if installed, else
+        xml.etree.ElementTree), clearing each <string> once read:
+        - Every <string> with a name attribute, except translatable="false"
+          resources (app names, URLs, ...), which are never translated
+        - Its text, including text inside child tags such as <b>, is stripped
         - Returns True if value is non-empty, False if empty
+        Files that are not well-formed XML fall back to a regex scan:
+        - Pattern: <string name="([^"]+)">(.*?)</string> with re.DOTALL
 
     Error Handling:
         - File not found: Logs error and returns empty dict
@@ -457,21 +427,34 @@ def load_strings_file(file_path: str) -> Dict[str, bool]:
         translated = sum(1 for has_value in strings.values() if has_value)
         print(f"Translation coverage: {translated}/{total}")
     """
-    strings = {}
-
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-            # Extract all <string> tags with name attribute and content
-            # re.DOTALL allows matching across newlines for multi-line strings
-            matches = re.findall(r'<string name=\"([^\"]+)\">(.*?)</string>', content, re.DOTALL)
-
-            for match in matches:
-                key, value = match
-                # Store True if value exists (not empty after stripping), False otherwise
-                strings[key] = value.strip() != ""
+        return _parse_strings_file(file_path)
     except Exception as e:
         print_colored(f"Error reading {file_path}: {e}", Fore.RED)
+        return {}
+
+
+def _parse_strings_file(file_path: str) -> Dict[str, bool]:
+    """Parse a strings XML file for load_strings_file(); read errors propagate."""
+    strings = {}
+
+    try:
+        for _, element in etree.iterparse(file_path, events=('end',)):
+            if element.tag == 'string':
+                name = element.get('name')
+                if name and element.get('translatable') != 'false':
+                    # Store True if value exists (not empty after stripping), False otherwise
+                    strings[name] = ''.join(element.itertext()).strip() != ""
+                element.clear()
+        return strings
+    except XMLParseError:
+        strings = {}  # Not well-formed: fall back to the regex scan
+
+    with open(file_path, 'r', encoding='utf-8') as file:
+        content = file.read()
+    # Extract all <string> tags with name attribute and content
+    for match in STRING_ENTRY_PATTERN.finditer(content):
+        strings[match.group(1)] = match.group(2).strip() != ""
 
     return strings
 
@@ -523,7 +506,7 @@ def load_all_strings_for_locale(locale_dir: str) -> Dict[str, bool]:
     """
     merged_strings = {}
 
-    for filename in ["strings.xml", "Lokalizable.xml"]:
+    for filename in STRINGS_FILE_NAMES:
         file_path = os.path.join(locale_dir, filename)
 
         if os.path.exists(file_path):
@@ -534,6 +517,38 @@ def load_all_strings_for_locale(locale_dir: str) -> Dict[str, bool]:
     return merged_strings
 
 
+def _find_project_languages(project_dir: str) -> Set[str]:
+    """
+    Return the language codes of values-XX directories under `project_dir`
+    that contain a strings.xml or Lokalizable.xml.
+
+    One os.scandir() walk: a values-XX directory's files are checked from
+    the listing made while descending into it, instead of with a separate
+    os.path.isfile() per candidate file. Like the os.walk() it replaces,
+    symlinked directories are checked but not descended into.
+    """
+    languages = set()
+    # (path, language code if it is a values-XX directory, descend into it)
+    stack = [(project_dir, None, True)]
+    while stack:
+        path, lang_code, descend = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        is_values_dir = entry.name.startswith('values-')
+                        if descend and (is_values_dir or not entry.is_symlink()):
+                            stack.append((entry.path,
+                                          # e.g. "de" from "values-de"
+                                          entry.name.split('-')[1] if is_values_dir else None,
+                                          not entry.is_symlink()))
+                    elif lang_code is not None and entry.name in STRINGS_FILE_NAMES:
+                        languages.add(lang_code)
+        except OSError:
+            continue
+    return languages
+
+
 def load_excluded_locales() -> Set[str]:
     """
     Load list of excluded locale codes from configuration file.
@@ -675,21 +690,12 @@ def compare_translations(
     # Load English strings as reference
     en_dir = os.path.join(values_dir, 'values')
     en_strings = load_all_strings_for_locale(en_dir)
+    # Only keys defined in English can be missing elsewhere
+    candidate_keys = keys_to_check & en_strings.keys()
 
     # Scan project to find supported languages
     # This ensures we only check locales that are actually used in the project
-    supported_languages = set()
-    for root, dirs, _ in os.walk(project_dir):
-        for dir_name in dirs:
-            if dir_name.startswith('values-'):
-                # Check if directory contains strings.xml or Lokalizable.xml
-                has_strings = os.path.isfile(os.path.join(root, dir_name, 'strings.xml'))
-                has_lokalizable = os.path.isfile(os.path.join(root, dir_name, 'Lokalizable.xml'))
-
-                if has_strings or has_lokalizable:
-                    # Extract language code (e.g., "de" from "values-de")
-                    lang_code = dir_name.split('-')[1]
-                    supported_languages.add(lang_code)
+    supported_languages = _find_project_languages(project_dir)
 
     # Check each locale in Lokalise directory
     for root, dirs, _ in os.walk(values_dir):
@@ -705,23 +711,17 @@ def compare_translations(
                 if lang_code in supported_languages:
                     lang_dir = os.path.join(root, dir_name)
                     lang_strings = load_all_strings_for_locale(lang_dir)
+                    translated_keys = {key for key, has_value in lang_strings.items() if has_value}
 
-                    # Check each key
-                    for key in keys_to_check:
-                        # Key must exist in English with a value
-                        if key in en_strings:
-                            # Check if missing or empty in this locale
-                            if key not in lang_strings or not lang_strings[key]:
-                                if key not in missing_translations:
-                                    missing_translations[key] = []
-                                missing_translations[key].append(lang_code)
+                    # Keys missing or empty in this locale, found with one set difference
+                    for key in candidate_keys - translated_keys:
+                        missing_translations.setdefault(key, []).append(lang_code)
 
     # Write missing translations report
     try:
-        with MISSING_TRANSLATIONS_CSV.open('w', newline='', encoding='utf-8') as csv_file:
+        with MISSING_TRANSLATIONS_CSV.open('w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csv_file:
             writer = csv.writer(csv_file)
-            for key, languages in missing_translations.items():
-                writer.writerow([key, ", ".join(languages)])
+            writer.writerows((key, ", ".join(languages)) for key, languages in missing_translations.items())
         print_colored(f"\nMissing translations written to missing_android_translations.csv", Fore.CYAN)
     except Exception as e:
         print_colored(f"Error writing to missing_android_translations.csv: {e}", Fore.RED)
@@ -738,11 +738,9 @@ def main() -> None:
     Orchestrates the complete scanning workflow:
     1. Load project configuration
     2. Validate paths exist
-    3. Start loading spinner animation
-    4. Extract string resource keys from Kotlin/Java/XML files
-    5. Compare translations across locales
-    6. Stop spinner and display results
-    7. Show summary table with statistics
+    3. Extract string resource keys from Kotlin/Java/XML files
+    4. Compare translations across locales
+    5. Show summary table with statistics
 
     Configuration Required:
         config/user_config.json must contain:
@@ -755,9 +753,6 @@ def main() -> None:
             }
         }
 
-    Global Variables:
-        stop_loading: Boolean flag to control spinner animation thread
-
     Reports Generated:
         - reports/android/final_result_android.csv
         - reports/android/total_keys_used_android.csv
@@ -810,19 +805,12 @@ def main() -> None:
         print_colored("Invalid or missing Lokalise Android path in config.", Fore.RED)
         return
 
-    # Start loading spinner in daemon thread
-    global stop_loading
-    stop_loading = False
-    threading.Thread(target=spinner, daemon=True).start()
-
     # Execute scanning workflow
     start_time = time.time()
     localized_keys, file_analysis = extract_localized_strings(android_project_path)
     missing_translations = compare_translations(values_dir, android_project_path, localized_keys)
 
-    # Stop spinner and calculate timing
-    stop_loading = True
-    time.sleep(0.2)  # Allow spinner to finish current animation
+    # Calculate timing
     end_time = time.time()
     execution_time_ms = int((end_time - start_time) * 1000)
 
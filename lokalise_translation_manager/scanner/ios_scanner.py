@@ -103,7 +103,7 @@ excluded_locales = en, base
 DEPENDENCIES:
 -------------
 Required:
-- Standard library: os, re, csv, time, threading, json, pathlib, configparser
+- Standard library: os, re, csv, sys, time, json, pathlib, configparser
 
 Optional (graceful fallback):
 - colorama: Colored console output
@@ -124,7 +124,7 @@ Via core workflow:
 EXAMPLE OUTPUT:
 ---------------
 When run, displays:
-    | Loading... (animated spinner)
+    Scanned 1024/1536 Swift files... (progress, interactive terminals only)
 
     Results have been written to final_result_ios.csv
     Total keys have been written to total_keys_used_ios.csv
@@ -145,7 +145,6 @@ PERFORMANCE:
 ------------
 - Scans ~100 Swift files in ~2-3 seconds
 - Memory efficient: streaming file processing
-- Thread-safe: Uses daemon thread for spinner animation
 
 AUTHORS:
 --------
@@ -157,12 +156,15 @@ import os
 import re
 import csv
 import time
-import threading
 import json
+import shutil
 from pathlib import Path
 from typing import Set, Dict, Tuple
 import configparser
 
+from ..utils.csv_utils import CSV_BUFFER_SIZE
+from ._scan_common import scan_source_files
+
 # Optional colorama support for colored console output
 try:
     from colorama import Fore, Style, init
@@ -197,6 +199,13 @@ TOTAL_KEYS_CSV = REPORTS_DIR / "total_keys_used_ios.csv"
 SWIFT_FILES_CSV = REPORTS_DIR / "swift_files.csv"
 MISSING_TRANSLATIONS_CSV = REPORTS_DIR / "missing_ios_translations.csv"
 
+# ==================== SCAN CONFIGURATION ====================
+
+# Captures the key (first parameter) from NSLocalizedString("key", comment: "...")
+KEY_PATTERN = re.compile(rb'NSLocalizedString\(\"([^\"]+)\",\s*comment\s*:\s*\"[^\"]*\"\)')
+# Source files scanned for keys, and the pattern used for each
+KEY_PATTERNS = ((('.swift',), KEY_PATTERN),)
+
 # ==================== UTILITY FUNCTIONS ====================
 
 def print_colored(text: str, color: str) -> None:
@@ -219,37 +228,6 @@ def print_colored(text: str, color: str) -> None:
     print(color + text if color_enabled else text)
 
 
-def spinner() -> None:
-    """
-    Display animated loading spinner in terminal.
-
-    Shows a rotating cursor animation (|/-\\) while scanning is in progress.
-    Runs in a daemon thread and automatically stops when global stop_loading
-    flag is set to True.
-
-    This provides visual feedback during long-running scan operations without
-    blocking the main thread.
-
-    Global Variables:
-        stop_loading: Boolean flag to stop the spinner animation
-
-    Note:
-        This function is designed to run in a daemon thread. It will
-        automatically terminate when the main program exits.
-
-    Example:
-        global stop_loading
-        stop_loading = False
-        threading.Thread(target=spinner, daemon=True).start()
-        # ... perform scanning ...
-        stop_loading = True
-    """
-    while not stop_loading:
-        for cursor in '|/-\\':
-            print('\r' + cursor + ' Loading...', end='', flush=True)
-            time.sleep(0.1)
-
-
 # ==================== CORE SCANNING FUNCTIONS ====================
 
 def extract_localized_strings(directory: str) -> Tuple[Set[str], Dict[str, int]]:
@@ -295,6 +273,11 @@ def extract_localized_strings(directory: str) -> Tuple[Set[str], Dict[str, int]]
             Views/Home.swift,12
             Models/User.swift,5
 
+    Performance:
+        Files are scanned by _scan_common.scan_source_files(): in a process
+        pool for projects with at least PARALLEL_SCAN_MIN_FILES .swift files,
+        otherwise in-process with threads overlapping the file reads.
+
     Error Handling:
         - Unreadable files: Logs error and continues with remaining files
         - CSV write errors: Logs error but doesn't stop execution
@@ -309,59 +292,36 @@ def extract_localized_strings(directory: str) -> Tuple[Set[str], Dict[str, int]]
         # Found 145 unique keys
         # Most used file: Views/MainViewController.swift
     """
-    localized_strings = set()
-    file_analysis = {}
-
-    # Regex pattern to match NSLocalizedString calls
-    # Captures the key (first parameter) from NSLocalizedString("key", comment: "...")
-    pattern = re.compile(r'NSLocalizedString\(\"([^\"]+)\",\s*comment\s*:\s*\"[^\"]*\"\)')
-
-    # Recursively walk through all files in directory
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.swift'):
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, directory)
-
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        matches = pattern.findall(content)
-                        localized_strings.update(matches)
-                        file_analysis[relative_path] = len(matches)
-                except Exception as e:
-                    print_colored(f"Error reading {file_path}: {e}", Fore.RED)
+    localized_strings, file_analysis = scan_source_files(
+        directory, KEY_PATTERNS, "Swift files", lambda message: print_colored(message, Fore.RED)
+    )
 
     # Create reports directory if it doesn't exist
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Write final_result_ios.csv: All unique keys
     try:
-        with FINAL_RESULT_CSV.open('w', newline='', encoding='utf-8') as csv_file:
+        with FINAL_RESULT_CSV.open('w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csv_file:
             writer = csv.writer(csv_file)
-            for string in sorted(localized_strings):
-                writer.writerow([string])
+            writer.writerows((string,) for string in sorted(localized_strings))
         print_colored("\nResults have been written to final_result_ios.csv", Fore.CYAN)
     except Exception as e:
         print_colored(f"Error writing to final_result_ios.csv: {e}", Fore.RED)
 
-    # Write total_keys_used_ios.csv: Same as above (legacy compatibility)
+    # Write total_keys_used_ios.csv: Same as above (legacy compatibility),
+    # copied rather than sorted and written again
     try:
-        with TOTAL_KEYS_CSV.open('w', newline='', encoding='utf-8') as csv_file:
-            writer = csv.writer(csv_file)
-            for string in sorted(localized_strings):
-                writer.writerow([string])
+        shutil.copyfile(FINAL_RESULT_CSV, TOTAL_KEYS_CSV)
         print_colored("\nTotal keys have been written to total_keys_used_ios.csv", Fore.CYAN)
     except Exception as e:
         print_colored(f"Error writing to total_keys_used_ios.csv: {e}", Fore.RED)
 
     # Write swift_files.csv: Per-file statistics
     try:
-        with SWIFT_FILES_CSV.open('w', newline='', encoding='utf-8') as csv_file:
+        with SWIFT_FILES_CSV.open('w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csv_file:
             writer = csv.writer(csv_file)
             writer.writerow(['File Path', 'Number of Keys'])
-            for file_path, count in file_analysis.items():
-                writer.writerow([file_path, count])
+            writer.writerows(file_analysis.items())
         print_colored("\nSwift file details have been written to swift_files.csv", Fore.CYAN)
     except Exception as e:
         print_colored(f"Error writing to swift_files.csv: {e}", Fore.RED)
@@ -398,7 +358,7 @@ def load_strings_file(file_path: str) -> Dict[str, str]:
             "error.network" = "Network error occurred";
 
     Parsing Logic:
-        1. Split line on '=' character
+        1. Split line at the first '=' (values may contain '=')
         2. Strip whitespace and quotes from key (left side)
         3. Strip whitespace, quotes, and semicolon from value (right side)
         4. Store in dictionary
@@ -416,23 +376,27 @@ def load_strings_file(file_path: str) -> Dict[str, str]:
         if "button.ok" in strings:
             print(f"OK button text: {strings['button.ok']}")
     """
-    strings = {}
-
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.readlines()
-
-            for line in content:
-                # Only process lines containing '=' (key-value pairs)
-                if '=' in line:
-                    key_value = line.split('=')
-                    # Strip quotes and whitespace from key
-                    key = key_value[0].strip().strip('"')
-                    # Strip semicolon, quotes, and whitespace from value
-                    value = key_value[1].strip().strip(';').strip().strip('"')
-                    strings[key] = value
+        return _parse_strings_file(file_path)
     except Exception as e:
         print_colored(f"Error reading {file_path}: {e}", Fore.RED)
+        return {}
+
+
+def _parse_strings_file(file_path: str) -> Dict[str, str]:
+    """Parse a Localizable.strings file for load_strings_file(); read errors propagate."""
+    strings = {}
+
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            # Only process lines containing '=' (key-value pairs)
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            # Strip quotes and whitespace from key
+            key = key.strip().strip('"')
+            # Strip semicolon, quotes, and whitespace from value
+            strings[key] = value.strip().strip(';').strip().strip('"')
 
     return strings
 
@@ -563,6 +527,8 @@ def compare_translations(
     # Load English strings as reference
     en_path = os.path.join(localizable_dir, 'en.lproj', 'Localizable.strings')
     en_strings = load_strings_file(en_path)
+    # Only keys defined in English can be missing elsewhere
+    candidate_keys = keys_to_check & en_strings.keys()
 
     # Scan all locale directories
     for language_dir in os.listdir(localizable_dir):
@@ -577,23 +543,17 @@ def compare_translations(
             # Load locale's strings file
             lang_path = os.path.join(localizable_dir, language_dir, 'Localizable.strings')
             lang_strings = load_strings_file(lang_path)
+            translated_keys = {key for key, value in lang_strings.items() if value.strip()}
 
-            # Check each key
-            for key in keys_to_check:
-                # Key must exist in English with a value
-                if key in en_strings:
-                    # Check if missing or empty in this locale
-                    if key not in lang_strings or not lang_strings[key].strip():
-                        if key not in missing_translations:
-                            missing_translations[key] = []
-                        missing_translations[key].append(lang_code)
+            # Keys missing or empty in this locale, found with one set difference
+            for key in candidate_keys - translated_keys:
+                missing_translations.setdefault(key, []).append(lang_code)
 
     # Write missing translations report
     try:
-        with MISSING_TRANSLATIONS_CSV.open('w', newline='', encoding='utf-8') as csv_file:
+        with MISSING_TRANSLATIONS_CSV.open('w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csv_file:
             writer = csv.writer(csv_file)
-            for key, languages in missing_translations.items():
-                writer.writerow([key, ", ".join(languages)])
+            writer.writerows((key, ", ".join(languages)) for key, languages in missing_translations.items())
         print_colored(f"\nMissing translations written to missing_ios_translations.csv", Fore.CYAN)
     except Exception as e:
         print_colored(f"Error writing to missing_ios_translations.csv: {e}", Fore.RED)
@@ -610,11 +570,9 @@ def main() -> None:
     Orchestrates the complete scanning workflow:
     1. Load project configuration
     2. Validate paths exist
-    3. Start loading spinner animation
-    4. Extract localization keys from Swift files
-    5. Compare translations across locales
-    6. Stop spinner and display results
-    7. Show summary table with statistics
+    3. Extract localization keys from Swift files
+    4. Compare translations across locales
+    5. Show summary table with statistics
 
     Configuration Required:
         config/user_config.json must contain:
@@ -627,9 +585,6 @@ def main() -> None:
             }
         }
 
-    Global Variables:
-        stop_loading: Boolean flag to control spinner animation thread
-
     Reports Generated:
         - reports/ios/final_result_ios.csv
         - reports/ios/total_keys_used_ios.csv
@@ -683,19 +638,12 @@ def main() -> None:
         print_colored("Invalid or missing Lokalise iOS path in config.", Fore.RED)
         return
 
-    # Start loading spinner in daemon thread
-    global stop_loading
-    stop_loading = False
-    threading.Thread(target=spinner, daemon=True).start()
-
     # Execute scanning workflow
     start_time = time.time()
     localized_keys, file_analysis = extract_localized_strings(ios_project_path)
     missing_translations = compare_translations(localizable_dir, localized_keys)
 
-    # Stop spinner and calculate timing
-    stop_loading = True
-    time.sleep(0.2)  # Allow spinner to finish current animation
+    # Calculate timing
     end_time = time.time()
     execution_time_ms = int((end_time - start_time) * 1000)
 
@@ -60,7 +60,8 @@ import os
 import csv
 from pathlib import Path
 from collections import defaultdict
-from .csv_utils import detect_csv_delimiter
+from concurrent.futures import ThreadPoolExecutor
+from .csv_utils import CSV_BUFFER_SIZE, detect_csv_delimiter
 
 try:
     from colorama import Fore, init
@@ -97,19 +98,26 @@ def load_missing_translations(file_path):
 
     Note:
         Uses automatic CSV delimiter detection to handle both comma and
-        semicolon delimited files correctly.
+        semicolon delimited files correctly. Scanner reports always have
+        exactly two columns, so comma-delimited rows are split directly;
+        the csv module is only used for other delimiters or quoted keys.
     """
     translations = defaultdict(list)
     if file_path.exists():
         try:
             # Detect CSV delimiter automatically
             delimiter = detect_csv_delimiter(file_path)
-            with file_path.open('r', encoding='utf-8') as csv_file:
-                reader = csv.reader(csv_file, delimiter=delimiter)
-                for row in reader:
-                    key = row[0]
-                    languages = row[1].split(', ') if len(row) > 1 else []
-                    translations[key] = languages
+            text = file_path.read_text(encoding='utf-8')
+            for line in text.splitlines():
+                if not line:
+                    continue
+                if delimiter != ',' or line.startswith('"'):
+                    row = next(csv.reader([line], delimiter=delimiter))
+                    key, languages = row[0], row[1] if len(row) > 1 else ''
+                else:
+                    key, _, languages = line.partition(',')
+                    languages = languages.strip('"')
+                translations[key] = [lang.strip() for lang in languages.split(',') if lang.strip()]
         except Exception as e:
             print_colored(f"Error reading {file_path}: {e}", Fore.RED)
     return translations
@@ -128,11 +136,10 @@ def merge_translations(ios_translations, android_translations):
     Returns:
         dict: Merged dictionary containing all unique keys
     """
-    merged = dict(ios_translations)
-    for key, langs in android_translations.items():
-        if key not in merged:
-            merged[key] = langs
-    return merged
+    # Both merges run in C: unpacking iOS first keeps the output order
+    # (iOS keys, then Android-only keys), unpacking it again last makes
+    # the iOS entry win for keys present on both platforms.
+    return {**ios_translations, **android_translations, **ios_translations}
 
 def write_final_csv(translations):
     """
@@ -147,7 +154,7 @@ def write_final_csv(translations):
         ms_test_2,"pl, sv"
     """
     try:
-        with FINAL_CSV.open('w', newline='', encoding='utf-8') as csv_file:
+        with FINAL_CSV.open('w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csv_file:
             writer = csv.writer(csv_file)
             for key, languages in translations.items():
                 writer.writerow([key, ", ".join(languages)])
@@ -173,7 +180,7 @@ def print_summary(ios, android, merged):
     total_ios = len(ios)
     total_android = len(android)
     total_merged = len(merged)
-    common = len(set(ios.keys()) & set(android.keys()))
+    common = len(ios.keys() & android.keys())
 
     if table_enabled:
         table = PrettyTable()
@@ -194,14 +201,17 @@ def run_merge():
     """
     Main function to execute the merge process.
 
-    Loads both iOS and Android translation reports, merges them,
-    writes the output, and displays summary statistics.
+    Loads both iOS and Android translation reports (concurrently), merges
+    them, writes the output, and displays summary statistics.
     """
     if not color_enabled:
         print("Colorama not installed. Running without colored output.")
 
-    ios = load_missing_translations(IOS_CSV)
-    android = load_missing_translations(ANDROID_CSV)
+    # The two reports are independent, so read them concurrently
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ios_future = pool.submit(load_missing_translations, IOS_CSV)
+        android_future = pool.submit(load_missing_translations, ANDROID_CSV)
+        ios, android = ios_future.result(), android_future.result()
 
     if not ios and not android:
         print_colored("No translation files found. Exiting.", Fore.RED)
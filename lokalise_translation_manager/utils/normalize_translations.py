@@ -8,8 +8,8 @@ This module normalizes and prepares translation data for OpenAI processing by:
 - Preparing final CSV for translation engine
 
 Workflow:
-    1. Read merged translation requirements (merged_result.csv)
-    2. Read English source translations (en_translations.csv)
+    1. Read English source translations (en_translations.csv)
+    2. Stream merged translation requirements (merged_result.csv) row by row
     3. Match keys requiring translation with their English source
     4. Normalize language codes (e.g., 'tr' → 'tr_TR', 'lt' → 'lt_LT')
     5. Filter out keys without English source
@@ -50,10 +50,15 @@ Example Data Flow:
 """
 
 import csv
+import io
+import re
 import time
 import sys
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from .csv_utils import detect_csv_delimiter
+from typing import Counter as CounterType, Dict, List, Optional, Tuple
+from .csv_utils import CSV_BUFFER_SIZE, detect_csv_delimiter
 from .language_config import get_lokalise_mappings
 
 try:
@@ -71,104 +76,143 @@ MERGED_RESULT_FILE = REPORTS_DIR / "merged_result.csv"
 EN_TRANSLATIONS_FILE = REPORTS_DIR / "en_translations.csv"
 OUTPUT_FILE = READY_DIR / "merged_translations_result.csv"
 
+# Columns read from en_translations.csv
+EN_FIELDNAMES: List[str] = ['key_id', 'translation_id', 'translation']
+
 # Supported language mappings loaded from centralized config (config/supported_languages.json)
 # To add/remove languages, edit the config file instead of this code
-LOKALISE_LANGUAGES = get_lokalise_mappings()
-
-def print_colored(text, color=None):
+LOKALISE_LANGUAGES: Dict[str, str] = get_lokalise_mappings()
+
+# Matches a whole comma-separated token (surrounding whitespace ignored) that is a
+# supported language code, so a row is tokenized and filtered in a single C-level scan.
+# Longer codes come first so that e.g. 'lt_LT' wins over 'lt'.
+_LANG_RE = re.compile(
+    r'(?:^|,)\s*('
+    + '|'.join(re.escape(code) for code in sorted(LOKALISE_LANGUAGES, key=len, reverse=True))
+    + r')\s*(?=,|$)'
+)
+
+def format_colored(text: str, color: Optional[str] = None) -> str:
     if colorama_available and color:
-        print(color + text + Style.RESET_ALL)
-    else:
-        print(text)
+        return color + text + Style.RESET_ALL
+    return text
+
+def print_colored(text: str, color: Optional[str] = None) -> None:
+    print(format_colored(text, color))
 
-def normalize_languages(languages, normalization_count):
+@lru_cache(maxsize=1024)
+def _normalize_codes(languages: str) -> Tuple[str, ...]:
+    """Return the normalized codes of a raw languages cell as a tuple (memoized)."""
+    # Tokens are split only by comma and surrounding whitespace is ignored;
+    # unsupported codes are dropped.
+    return tuple(LOKALISE_LANGUAGES[code] for code in _LANG_RE.findall(languages))
+
+def normalize_languages(languages: str, normalization_count: CounterType[str]) -> str:
     """
     Normalize and clean language codes correctly.
 
+    Most keys share a handful of language combinations, so the parsing of each
+    distinct raw value is cached and only the counts are updated per row.
+
     Args:
         languages: Comma-separated language codes
-        normalization_count: Dictionary to track normalization counts
+        normalization_count: Counter tracking how often each normalized code appears
 
     Returns:
         Normalized comma-separated language codes
     """
-    normalized = []
-    # CRITICAL FIX APPLIED HERE:
-    # 1. Split only by comma
-    # 2. Use .strip() to remove invisible whitespace
-    for lang in languages.split(','):
-        clean_lang = lang.strip()
-        if clean_lang in LOKALISE_LANGUAGES:
-            normalized_lang = LOKALISE_LANGUAGES[clean_lang]
-            normalized.append(normalized_lang)
-            normalization_count[normalized_lang] += 1
+    normalized = _normalize_codes(languages)
+    normalization_count.update(normalized)
     return ','.join(normalized)
 
-def process_normalization():
+def load_en_translations() -> Dict[str, Tuple[str, str]]:
+    """
+    Parse en_translations.csv into {key_id: (translation_id, translation)}.
+
+    Uses a plain csv.reader with column indices resolved once from the header,
+    so no dict is built per row and only the two needed columns are kept.
+    """
+    delimiter_en = detect_csv_delimiter(EN_TRANSLATIONS_FILE)
+    with EN_TRANSLATIONS_FILE.open('r', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as en_file:
+        en_reader = csv.reader(en_file, delimiter=delimiter_en)
+        en_header = next(en_reader, None) or EN_FIELDNAMES
+        i_kid, i_tid, i_tr = (en_header.index(name) for name in EN_FIELDNAMES)
+        return {row[i_kid]: (row[i_tid], row[i_tr]) for row in en_reader}
+
+def process_normalization() -> None:
     print_colored("\nStarting normalization and merge process...", Fore.CYAN)
     start_time = time.time()
     
-    normalization_count = {lang: 0 for lang in LOKALISE_LANGUAGES.values()}
+    # Seeded with zeros so every supported language shows up in the summary table
+    normalization_count: CounterType[str] = Counter(dict.fromkeys(LOKALISE_LANGUAGES.values(), 0))
+    total_keys_count = 0
+    en_keys_count = 0
     merged_keys_count = 0
     skipped_keys_count = 0
 
     try:
         READY_DIR.mkdir(parents=True, exist_ok=True)
 
-        # DETAILED LOG: FILE READING
-        print_colored(f"-> Reading keys needing translation from '{MERGED_RESULT_FILE.name}'...", Fore.BLUE)
         if not MERGED_RESULT_FILE.exists():
             raise FileNotFoundError(f"Input file not found: {MERGED_RESULT_FILE}")
 
-        delimiter_merged = detect_csv_delimiter(MERGED_RESULT_FILE)
-        with MERGED_RESULT_FILE.open('r', encoding='utf-8') as merged_file:
-            merged_reader = csv.DictReader(merged_file, delimiter=delimiter_merged)
-            merged_data = {row['key_id']: row for row in merged_reader}
-        print_colored(f"   Found {len(merged_data)} total keys.", Fore.BLUE)
-
+        # DETAILED LOG: FILE READING
+        # English translations are loaded up front so merged_result.csv can be
+        # streamed row by row instead of being materialized in memory.
         print_colored(f"-> Reading available English translations from '{EN_TRANSLATIONS_FILE.name}'...", Fore.BLUE)
         if not EN_TRANSLATIONS_FILE.exists():
             raise FileNotFoundError(f"English translations file not found: {EN_TRANSLATIONS_FILE}")
 
-        delimiter_en = detect_csv_delimiter(EN_TRANSLATIONS_FILE)
-        with EN_TRANSLATIONS_FILE.open('r', encoding='utf-8') as en_file:
-            en_reader = csv.DictReader(en_file, delimiter=delimiter_en)
-            en_data = {row['key_id']: row for row in en_reader}
-        print_colored(f"   Found {len(en_data)} English translations.", Fore.BLUE)
-        
+        en_data = load_en_translations()
+        en_keys_count = len(en_data)
+        print_colored(f"   Found {en_keys_count} English translations.", Fore.BLUE)
+
+        print_colored(f"-> Streaming keys needing translation from '{MERGED_RESULT_FILE.name}'...", Fore.BLUE)
         print_colored("\n-> Starting merge process...", Fore.CYAN)
-        output_data = []
-        for key_id, merged_row in merged_data.items():
-            key_name = merged_row.get('key_name', 'N/A')
-            # DETAILED LOG: MERGE PROCESS FOR EACH KEY
-            if key_id in en_data:
-                print_colored(f"   [OK] Match for key '{key_name}' ({key_id}) found. Preparing for translation.", Fore.GREEN)
-                
-                normalized_languages = normalize_languages(merged_row['languages'], normalization_count)
-                if not normalized_languages:
-                    print_colored(f"      - WARNING: Key '{key_name}' has no valid languages after normalization. Skipping.", Fore.YELLOW)
-                    skipped_keys_count += 1
-                    continue
-
-                output_data.append({
-                    'key_name': key_name,
-                    'key_id': key_id,
-                    'languages': normalized_languages,
-                    'translation_id': en_data[key_id]['translation_id'],
-                    'translation': en_data[key_id]['translation']
-                })
-                merged_keys_count += 1
-            else:
-                print_colored(f"   [SKIP] No English translation for key '{key_name}' ({key_id}). Skipping.", Fore.YELLOW)
-                skipped_keys_count += 1
-        
-        print_colored(f"\n-> Merge complete. Writing {merged_keys_count} keys to '{OUTPUT_FILE.name}'...", Fore.CYAN)
-        with OUTPUT_FILE.open('w', newline='', encoding='utf-8') as output_file:
-            fieldnames=['key_name', 'key_id', 'languages', 'translation_id', 'translation']
+        delimiter_merged = detect_csv_delimiter(MERGED_RESULT_FILE)
+        with MERGED_RESULT_FILE.open('r', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as merged_file, \
+                OUTPUT_FILE.open('w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as output_file:
+            fieldnames = ['key_name', 'key_id', 'languages', 'translation_id', 'translation']
             writer = csv.DictWriter(output_file, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(output_data)
-        
+
+            merged_reader = csv.reader(merged_file, delimiter=delimiter_merged)
+            merged_header = next(merged_reader, None) or ['key_name', 'key_id', 'languages']
+            i_kid = merged_header.index('key_id')
+            i_lang = merged_header.index('languages')
+            i_name = merged_header.index('key_name') if 'key_name' in merged_header else None
+
+            for merged_row in merged_reader:
+                total_keys_count += 1
+                key_id = merged_row[i_kid]
+                key_name = merged_row[i_name] if i_name is not None else 'N/A'
+                # DETAILED LOG: MERGE PROCESS FOR EACH KEY
+                en_entry = en_data.get(key_id)
+                if en_entry is not None:
+                    print_colored(f"   [OK] Match for key '{key_name}' ({key_id}) found. Preparing for translation.", Fore.GREEN)
+
+                    normalized_languages = normalize_languages(merged_row[i_lang], normalization_count)
+                    if not normalized_languages:
+                        print_colored(f"      - WARNING: Key '{key_name}' has no valid languages after normalization. Skipping.", Fore.YELLOW)
+                        skipped_keys_count += 1
+                        continue
+
+                    translation_id, translation = en_entry
+                    writer.writerow({
+                        'key_name': key_name,
+                        'key_id': key_id,
+                        'languages': normalized_languages,
+                        'translation_id': translation_id,
+                        'translation': translation
+                    })
+                    merged_keys_count += 1
+                else:
+                    print_colored(f"   [SKIP] No English translation for key '{key_name}' ({key_id}). Skipping.", Fore.YELLOW)
+                    skipped_keys_count += 1
+
+        print_colored(f"   Found {total_keys_count} total keys.", Fore.BLUE)
+        print_colored(f"\n-> Merge complete. Wrote {merged_keys_count} keys to '{OUTPUT_FILE.name}'.", Fore.CYAN)
+
         print_colored(f"\n✅ Process finished successfully.", Fore.GREEN)
 
     except FileNotFoundError as e:
@@ -179,20 +223,24 @@ def process_normalization():
 
     finally:
         elapsed = time.time() - start_time
-        print_colored("\n===== NORMALIZATION SUMMARY =====", Fore.CYAN)
-        print(f"Total keys needing translation: {len(merged_data)}")
-        print(f"Total English translations available: {len(en_data)}")
-        print_colored(f"Keys successfully merged and prepared: {merged_keys_count}", Fore.GREEN)
-        print_colored(f"Keys skipped (no EN translation found): {skipped_keys_count}", Fore.YELLOW)
-        print(f"Execution time: {elapsed:.2f} seconds")
+        # Build the whole summary first and emit it with a single write
+        buf = io.StringIO()
+        buf.write(format_colored("\n===== NORMALIZATION SUMMARY =====", Fore.CYAN) + "\n")
+        buf.write(f"Total keys needing translation: {total_keys_count}\n")
+        buf.write(f"Total English translations available: {en_keys_count}\n")
+        buf.write(format_colored(f"Keys successfully merged and prepared: {merged_keys_count}", Fore.GREEN) + "\n")
+        buf.write(format_colored(f"Keys skipped (no EN translation found): {skipped_keys_count}", Fore.YELLOW) + "\n")
+        buf.write(f"Execution time: {elapsed:.2f} seconds\n")
 
         table_data = [[lang, count] for lang, count in normalization_count.items()]
         if colorama_available and 'tabulate' in sys.modules:
-            print(tabulate(table_data, headers=["Language", "Count"], tablefmt="grid"))
+            buf.write(tabulate(table_data, headers=["Language", "Count"], tablefmt="grid") + "\n")
         else:
-            print("\nLanguage normalization counts:")
+            buf.write("\nLanguage normalization counts:\n")
             for lang, count in normalization_count.items():
-                print(f"  {lang}: {count}")
+                buf.write(f"  {lang}: {count}\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     process_normalization()
@@ -36,6 +36,12 @@ Configuration File:
             }
         }
 
+Discovery Index:
+    Location: config/plugins_index.json
+    Caches {"plugin_name.py": {"type": ..., "mtime_ns": ..., "size": ...}} so
+    warm runs only re-read plugin files whose mtime or size changed. It is
+    rebuilt automatically and safe to delete.
+
 Usage:
     from lokalise_translation_manager.utils.plugin_manager import (
         load_plugin_config,
@@ -56,8 +62,12 @@ Usage:
 """
 
 import json
+import mmap
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 try:
     from colorama import Fore
@@ -70,9 +80,31 @@ except ImportError:
         YELLOW = ''
         RED = ''
 
+# orjson is optional: it parses and serializes the config considerably faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 CONFIG_FILE = BASE_DIR / "config" / "plugins_config.json"
 PLUGINS_DIR = BASE_DIR / "lokalise_translation_manager" / "plugins"
+PLUGINS_INDEX_FILE = BASE_DIR / "config" / "plugins_index.json"
+
+# Plugin type markers in priority order, matched in a single pass over raw bytes
+PLUGIN_TYPES: Tuple[str, ...] = ('ACTION', 'EXTENSION', 'PROMPT')
+_MARKER_RE = re.compile(rb'\[(ACTION|EXTENSION|PROMPT)\]')
+
+# Files smaller than this are read directly; mmap setup costs more than the copy
+MMAP_MIN_SIZE = 4096
+
+# Parsed plugin configuration, reused while the config file's
+# (st_mtime_ns, st_size) signature is unchanged
+_config_cache: Optional[Dict] = None
+_config_signature: Optional[Tuple[int, int]] = None
+
+# Names of explicitly enabled plugins in the cached config, built on first use
+_enabled_plugins: Optional[FrozenSet[str]] = None
 
 DEFAULT_CONFIG = {
     "_comment": "Plugin Configuration File - Enable/Disable plugins without deleting them",
@@ -94,9 +126,32 @@ DEFAULT_CONFIG = {
 }
 
 
+def _json_loads(data: bytes) -> Dict:
+    """Parse JSON bytes with orjson when available, else the stdlib json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj: Dict) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json_atomic(path: Path, obj: Dict) -> None:
+    """Write obj as JSON to a sibling temp file and swap it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(path.name + '.tmp')
+    tmp_file.write_bytes(_json_dumps(obj))
+    os.replace(tmp_file, path)
+
+
 def print_colored(text: str, color: str) -> None:
     """Print colored text with colorama fallback."""
-    print(color + text if color_enabled else text)
+    # Fore falls back to empty strings without colorama, so no branch is needed
+    print(color + text)
 
 
 def load_plugin_config() -> Dict:
@@ -110,19 +165,37 @@ def load_plugin_config() -> Dict:
         - Creates default config if file doesn't exist
         - Returns default config on parse errors
         - Always returns a valid dictionary
+        - Returns a cached dict while the file's mtime/size are unchanged;
+          callers that modify it must persist it with save_plugin_config()
     """
-    if not CONFIG_FILE.exists():
+    global _config_cache, _config_signature, _enabled_plugins
+
+    # A single stat() both checks existence and provides the cache signature
+    try:
+        stat = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
         print_colored(
             f"Plugin config not found. Creating default: {CONFIG_FILE}",
             Fore.YELLOW
         )
         save_plugin_config(DEFAULT_CONFIG)
         return DEFAULT_CONFIG
+    except OSError as e:
+        print_colored(
+            f"Error loading plugin config: {e}. Using defaults.",
+            Fore.RED
+        )
+        return DEFAULT_CONFIG
 
     try:
-        with CONFIG_FILE.open('r', encoding='utf-8') as f:
-            config = json.load(f)
-            return config
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if _config_cache is not None and signature == _config_signature:
+            return _config_cache
+
+        config = _json_loads(CONFIG_FILE.read_bytes())
+        _config_cache, _config_signature = config, signature
+        _enabled_plugins = None  # Built from the previous config
+        return config
     except Exception as e:
         print_colored(
             f"Error loading plugin config: {e}. Using defaults.",
@@ -131,6 +204,14 @@ def load_plugin_config() -> Dict:
         return DEFAULT_CONFIG
 
 
+def invalidate_plugin_config_cache() -> None:
+    """Drop the cached plugin configuration so the next load re-reads the file."""
+    global _config_cache, _config_signature, _enabled_plugins
+    _config_cache = None
+    _config_signature = None
+    _enabled_plugins = None
+
+
 def save_plugin_config(config: Dict) -> None:
     """
     Save plugin configuration to config/plugins_config.json.
@@ -141,16 +222,41 @@ def save_plugin_config(config: Dict) -> None:
     Note:
         - Creates config directory if it doesn't exist
         - Writes with UTF-8 encoding and indentation
+        - Writes to a temporary file and swaps it in with os.replace(), so
+          an interrupted save never leaves a truncated config behind
+        - Invalidates the load_plugin_config() cache
         - Handles errors gracefully
     """
+    invalidate_plugin_config_cache()
     try:
-        CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with CONFIG_FILE.open('w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        _write_json_atomic(CONFIG_FILE, config)
     except Exception as e:
         print_colored(f"Error saving plugin config: {e}", Fore.RED)
 
 
+def build_enabled_set(config: Dict, plugin_names: Iterable[str]) -> FrozenSet[str]:
+    """
+    Return the subset of plugin_names that are enabled under config.
+
+    Args:
+        config: Plugin configuration
+        plugin_names: Plugin filenames to check (e.g. discovered plugins)
+
+    Returns:
+        FrozenSet[str]: Enabled plugin filenames, for O(1) membership checks
+
+    Note:
+        - Same rules as is_plugin_enabled(): unlisted plugins follow the
+          auto_discover_new_plugins setting, listed ones their "enabled" flag
+    """
+    plugins = config.get("plugins", {})
+    auto_discover = config.get("settings", {}).get("auto_discover_new_plugins", True)
+    return frozenset(
+        name for name in plugin_names
+        if (plugins[name].get("enabled", True) if name in plugins else auto_discover)
+    )
+
+
 def is_plugin_enabled(plugin_name: str, config: Optional[Dict] = None) -> bool:
     """
     Check if a plugin is enabled in the configuration.
@@ -166,48 +272,103 @@ def is_plugin_enabled(plugin_name: str, config: Optional[Dict] = None) -> bool:
         - Returns True if plugin not in config and auto_discover is enabled
         - Returns False if plugin explicitly disabled
         - Returns True by default for backward compatibility
+        - For the cached config, listed plugins are answered from a
+          precomputed frozenset of enabled names
     """
+    global _enabled_plugins
+
     if config is None:
         config = load_plugin_config()
 
     plugins = config.get("plugins", {})
-    settings = config.get("settings", {})
 
     if plugin_name not in plugins:
         # Plugin not in config - check auto_discover setting
+        settings = config.get("settings", {})
         auto_discover = settings.get("auto_discover_new_plugins", True)
         return auto_discover
 
     # Plugin in config - check enabled status
+    if config is _config_cache:
+        if _enabled_plugins is None:
+            _enabled_plugins = build_enabled_set(config, plugins)
+        return plugin_name in _enabled_plugins
     return plugins[plugin_name].get("enabled", True)
 
 
-def detect_plugin_type(plugin_path: Path) -> Optional[str]:
+def detect_plugin_type(plugin_path: Union[str, Path]) -> Optional[str]:
     """
     Detect plugin type by scanning for marker comments.
 
     Args:
-        plugin_path: Path to the plugin file
+        plugin_path: Path to the plugin file (Path or str)
 
     Returns:
         Optional[str]: Plugin type ("ACTION", "EXTENSION", "PROMPT") or None
 
     Note:
         - Scans file content for [ACTION], [EXTENSION], or [PROMPT] markers
-        - Returns first marker found
+        - If several markers are present, ACTION wins over EXTENSION,
+          which wins over PROMPT
         - Returns None if no marker found or file unreadable
+        - Results are memoized per (path, mtime, size), so unchanged
+          files are not re-read
     """
     try:
-        content = plugin_path.read_text(encoding='utf-8')
-        if '[ACTION]' in content:
-            return 'ACTION'
-        elif '[EXTENSION]' in content:
-            return 'EXTENSION'
-        elif '[PROMPT]' in content:
-            return 'PROMPT'
+        stat = os.stat(plugin_path)
+    except OSError:
+        return None
+    return _detect_plugin_type_cached(os.fspath(plugin_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _detect_plugin_type_cached(path_str: str, mtime_ns: int, size: int) -> Optional[str]:
+    """
+    Scan a plugin file for its type marker.
+
+    mtime_ns and size are only part of the cache key: a modified file gets
+    a new key and is scanned again. Larger files are memory-mapped so the
+    regex runs over the page cache without copying the file into a bytes
+    object.
+    """
+    try:
+        with open(path_str, 'rb') as f:
+            if size < MMAP_MIN_SIZE:
+                matches = _MARKER_RE.findall(f.read())
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    matches = _MARKER_RE.findall(mm)
+    except (OSError, ValueError):
+        return None
+
+    found = {m.decode('ascii') for m in matches}
+    for plugin_type in PLUGIN_TYPES:
+        if plugin_type in found:
+            return plugin_type
+    return None
+
+
+def _load_plugins_index() -> Dict[str, Dict]:
+    """
+    Load the on-disk plugin discovery index.
+
+    Returns:
+        Dict[str, Dict]: {plugin_name: {"type", "mtime_ns", "size"}}, or an
+        empty dict if the index is missing or unreadable
+    """
+    try:
+        index = _json_loads(PLUGINS_INDEX_FILE.read_bytes())
+    except Exception:
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _save_plugins_index(index: Dict[str, Dict]) -> None:
+    """Persist the plugin discovery index; failures only cost a rescan next run."""
+    try:
+        _write_json_atomic(PLUGINS_INDEX_FILE, index)
     except Exception:
         pass
-    return None
 
 
 def discover_all_plugins() -> Dict[str, str]:
@@ -223,19 +384,51 @@ def discover_all_plugins() -> Dict[str, str]:
         - Excludes __init__.py files
         - Detects plugin type by marker
         - Returns empty dict if plugins directory doesn't exist
+        - Marker detection is skipped for files whose mtime/size match the
+          on-disk index (config/plugins_index.json)
     """
-    discovered = {}
+    discovered: Dict[str, str] = {}
 
     if not PLUGINS_DIR.exists():
         return discovered
 
-    for plugin_file in PLUGINS_DIR.glob('*.py'):
-        if plugin_file.name == '__init__.py':
-            continue
+    index = _load_plugins_index()
+    new_index: Dict[str, Dict] = {}
+
+    # os.scandir yields DirEntry objects with cached type info and plain str
+    # paths, avoiding the Path allocation and re-stat that glob() does per file
+    with os.scandir(PLUGINS_DIR) as entries:
+        for dir_entry in entries:
+            name = dir_entry.name
+            if name == '__init__.py' or not name.endswith('.py'):
+                continue
+
+            try:
+                if not dir_entry.is_file():
+                    continue
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+
+            entry = index.get(name)
+            if (isinstance(entry, dict)
+                    and entry.get('mtime_ns') == stat.st_mtime_ns
+                    and entry.get('size') == stat.st_size):
+                plugin_type = entry.get('type')
+            else:
+                plugin_type = _detect_plugin_type_cached(dir_entry.path, stat.st_mtime_ns, stat.st_size)
+
+            # Files without a marker are indexed too, so they are not re-read
+            new_index[name] = {
+                'type': plugin_type,
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+            }
+            if plugin_type:
+                discovered[name] = plugin_type
 
-        plugin_type = detect_plugin_type(plugin_file)
-        if plugin_type:
-            discovered[plugin_file.name] = plugin_type
+    if new_index != index:
+        _save_plugins_index(new_index)
 
     return discovered
 
@@ -282,23 +475,50 @@ def sync_plugin_config() -> Tuple[List[str], List[str]]:
                 }
                 new_plugins.append(plugin_name)
 
-    # Mark missing plugins (but don't delete entries)
-    for plugin_name in config.get("plugins", {}).keys():
-        if plugin_name not in discovered:
+    # Mark missing plugins (but don't delete entries) and clear the flag on
+    # plugins that are present, in a single pass over the configured entries
+    for plugin_name, plugin_info in config.get("plugins", {}).items():
+        if plugin_name in discovered:
+            plugin_info.pop("_missing", None)
+        else:
             missing_plugins.append(plugin_name)
-            # Optionally mark as missing
-            config["plugins"][plugin_name]["_missing"] = True
-
-    # Remove _missing flag for plugins that are present
-    for plugin_name in discovered.keys():
-        if plugin_name in config.get("plugins", {}):
-            config["plugins"][plugin_name].pop("_missing", None)
+            plugin_info["_missing"] = True
 
     save_plugin_config(config)
 
     return new_plugins, missing_plugins
 
 
+def get_enabled_plugins_grouped() -> Dict[str, List[str]]:
+    """
+    Get enabled plugins for every type in a single pass.
+
+    Returns:
+        Dict[str, List[str]]: Enabled plugin filenames grouped by type,
+                              e.g., {"ACTION": [...], "EXTENSION": [...], "PROMPT": [...]}
+
+    Note:
+        - Loads the configuration and discovers plugins once for all types
+        - Every known type is present, with an empty list if nothing is enabled
+        - Same filtering rules as get_enabled_plugins_by_type()
+
+    Example:
+        grouped = get_enabled_plugins_grouped()
+        for plugin in grouped["ACTION"]:
+            print(f"Executing {plugin}")
+    """
+    config = load_plugin_config()
+    discovered = discover_all_plugins()
+    enabled = build_enabled_set(config, discovered)
+    grouped: Dict[str, List[str]] = {plugin_type: [] for plugin_type in PLUGIN_TYPES}
+
+    for plugin_name, discovered_type in discovered.items():
+        if plugin_name in enabled:
+            grouped.setdefault(discovered_type, []).append(plugin_name)
+
+    return grouped
+
+
 def get_enabled_plugins_by_type(plugin_type: str) -> List[str]:
     """
     Get list of enabled plugins of a specific type.
@@ -313,6 +533,7 @@ def get_enabled_plugins_by_type(plugin_type: str) -> List[str]:
         - Only returns plugins that exist in the directory
         - Only returns plugins that are enabled in config
         - Respects auto_discover setting for unlisted plugins
+        - Callers needing several types should use get_enabled_plugins_grouped()
 
     Example:
         action_plugins = get_enabled_plugins_by_type("ACTION")
@@ -349,35 +570,43 @@ def print_plugin_status() -> None:
     config = load_plugin_config()
     discovered = discover_all_plugins()
 
-    print_colored("\n📦 Plugin Configuration Status:", Fore.CYAN)
-    print_colored(f"  Config file: {CONFIG_FILE}", Fore.CYAN)
-    print_colored(f"  Plugins directory: {PLUGINS_DIR}\n", Fore.CYAN)
+    # Every line is color-prefixed up front and the report is printed with a
+    # single call, instead of one print per plugin
+    cyan, green, yellow = Fore.CYAN, Fore.GREEN, Fore.YELLOW
+    lines = [
+        f"{cyan}\n📦 Plugin Configuration Status:",
+        f"{cyan}  Config file: {CONFIG_FILE}",
+        f"{cyan}  Plugins directory: {PLUGINS_DIR}\n",
+    ]
 
     # Discovered plugins
-    print_colored(f"Discovered Plugins: {len(discovered)}", Fore.GREEN)
+    enabled = build_enabled_set(config, discovered)
+    lines.append(f"{green}Discovered Plugins: {len(discovered)}")
     for plugin_name, plugin_type in discovered.items():
-        enabled = is_plugin_enabled(plugin_name, config)
-        status = "✅ ENABLED" if enabled else "❌ DISABLED"
-        color = Fore.GREEN if enabled else Fore.YELLOW
-        print_colored(f"  {status} [{plugin_type}] {plugin_name}", color)
+        if plugin_name in enabled:
+            lines.append(f"{green}  ✅ ENABLED [{plugin_type}] {plugin_name}")
+        else:
+            lines.append(f"{yellow}  ❌ DISABLED [{plugin_type}] {plugin_name}")
 
     # Missing plugins (in config but not discovered)
     config_plugins = config.get("plugins", {})
     missing = [p for p in config_plugins.keys() if p not in discovered]
 
     if missing:
-        print_colored(f"\nMissing Plugins (in config but not found): {len(missing)}", Fore.YELLOW)
+        lines.append(f"{yellow}\nMissing Plugins (in config but not found): {len(missing)}")
         for plugin_name in missing:
             plugin_info = config_plugins[plugin_name]
             plugin_type = plugin_info.get("type", "UNKNOWN")
-            print_colored(f"  ⚠️  [{plugin_type}] {plugin_name}", Fore.YELLOW)
+            lines.append(f"{yellow}  ⚠️  [{plugin_type}] {plugin_name}")
 
     # Settings
     settings = config.get("settings", {})
-    print_colored("\nSettings:", Fore.CYAN)
-    print_colored(f"  Auto-discover new plugins: {settings.get('auto_discover_new_plugins', True)}", Fore.CYAN)
-    print_colored(f"  Warn on disabled plugins: {settings.get('warn_on_disabled_plugins', True)}", Fore.CYAN)
-    print_colored(f"  Fail on plugin error: {settings.get('fail_on_plugin_error', False)}", Fore.CYAN)
+    lines.append(f"{cyan}\nSettings:")
+    lines.append(f"{cyan}  Auto-discover new plugins: {settings.get('auto_discover_new_plugins', True)}")
+    lines.append(f"{cyan}  Warn on disabled plugins: {settings.get('warn_on_disabled_plugins', True)}")
+    lines.append(f"{cyan}  Fail on plugin error: {settings.get('fail_on_plugin_error', False)}")
+
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
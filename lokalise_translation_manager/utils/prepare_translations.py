@@ -15,8 +15,8 @@ Workflow:
     5. Write enriched data to ready_to_translations.csv
 
 Translation ID Lookup:
-    The module builds a mapping: {key_id: {language_iso: translation_id}}
-    This allows quick lookup of translation IDs for each key-language pair.
+    The module builds a flat mapping: {(key_id, language_iso): translation_id}
+    This allows a single-probe lookup of the translation ID for each key-language pair.
 
 Turkish Language Hotfix:
     Lokalise stores Turkish translations with code 'tr', but the normalized
@@ -52,8 +52,9 @@ Example Data Flow:
 """
 
 import csv
+import sys
 from pathlib import Path
-from .csv_utils import detect_csv_delimiter
+from .csv_utils import CSV_BUFFER_SIZE, CSV_WRITE_BATCH_SIZE, detect_csv_delimiter_cached
 
 try:
     from colorama import init, Fore, Style
@@ -61,6 +62,23 @@ try:
     init(autoreset=True)
 except ImportError:
     colorama_available = False
+    class Fore:
+        BLUE = ''
+        CYAN = ''
+        GREEN = ''
+        YELLOW = ''
+        RED = ''
+    class Style:
+        RESET_ALL = ''
+
+# pyarrow is optional: when installed, all_translation_ids.csv is parsed by
+# its multithreaded C++ CSV reader instead of the csv module
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    pyarrow_available = True
+except ImportError:
+    pyarrow_available = False
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 REPORTS_DIR = BASE_DIR.parent / "reports"
@@ -68,22 +86,108 @@ READY_DIR = BASE_DIR.parent / "ready_to_be_translated"
 MERGED_TRANSLATIONS_FILE = READY_DIR / "merged_translations_result.csv"
 ALL_TRANSLATION_IDS_FILE = REPORTS_DIR / "all_translation_ids.csv"
 OUTPUT_FILE = REPORTS_DIR / "ready_to_translations.csv"
+ID_LOOKUP_COLUMNS = ['key_id', 'language_iso', 'translation_id']
+# Normalized language codes that Lokalise stores under a different code.
+# Lokalise keeps Turkish as 'tr' while normalization produces 'tr_TR'.
+LANGUAGE_LOOKUP_ALIASES = {'tr_TR': 'tr'}
+# Reverse view used while building the lookup: Lokalise code -> normalized codes
+_ALIASES_BY_LOOKUP_CODE = {}
+for _code, _lookup_code in LANGUAGE_LOOKUP_ALIASES.items():
+    _ALIASES_BY_LOOKUP_CODE.setdefault(_lookup_code, []).append(_code)
+# How many missing (key, language) pairs to list in the end-of-run warning
+MISSING_ID_SAMPLE_SIZE = 10
+OUTPUT_FIELDNAMES = ['key_name', 'key_id', 'languages', 'translation_id', 'translation']
 
 def print_colored(text, color=None):
-    if colorama_available and color:
-        print(color + text + Style.RESET_ALL)
+    # Fore/Style fall back to empty strings, so only a missing color needs a branch
+    if color:
+        print(f"{color}{text}{Style.RESET_ALL}")
     else:
         print(text)
 
+def _read_translation_id_rows(delimiter):
+    """
+    Yield (key_id, language_iso, translation_id) cell tuples from all_translation_ids.csv.
+
+    Uses pyarrow's CSV reader when available (all columns kept as strings),
+    otherwise a plain csv.reader with column indices resolved once from the
+    header, avoiding a dict allocation per row.
+    """
+    if pyarrow_available:
+        table = pa_csv.read_csv(
+            ALL_TRANSLATION_IDS_FILE,
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in ID_LOOKUP_COLUMNS},
+                include_columns=ID_LOOKUP_COLUMNS,
+                strings_can_be_null=False
+            )
+        )
+        yield from zip(*(table.column(name).to_pylist() for name in ID_LOOKUP_COLUMNS))
+        return
+
+    with ALL_TRANSLATION_IDS_FILE.open('r', encoding='utf-8', newline='') as csvfile:
+        reader = csv.reader(csvfile, delimiter=delimiter)
+        header = next(reader, None) or ID_LOOKUP_COLUMNS
+        i_kid, i_lang, i_tid = (header.index(name) for name in ID_LOOKUP_COLUMNS)
+
+        for row in reader:
+            if row:
+                yield row[i_kid], row[i_lang], row[i_tid]
+
+def _parse_translation_id_lookup():
+    """
+    Parse all_translation_ids.csv into the flat lookup table.
+
+    Returns:
+        Tuple[Dict[Tuple[str, str], str], int, List[str]]: The lookup table, the
+        number of keys read and the keys whose language and ID lists differ in length
+    """
+    id_lookup = {}
+    keys_count = 0
+    mismatched_keys = []
+    delimiter = detect_csv_delimiter_cached(ALL_TRANSLATION_IDS_FILE)
+    for key_id, languages, translation_ids in _read_translation_id_rows(delimiter):
+        # Cells are machine-written comma lists ("de,fr" / "11,12"); dropping
+        # spaces in one C-level call replaces a per-element strip()
+        languages = languages.replace(' ', '')
+        translation_ids = translation_ids.replace(' ', '')
+
+        # Create (key, language) → ID entries for this key
+        keys_count += 1
+        if languages and translation_ids:
+            # Trailing or doubled commas leave empty tokens, which are not codes or IDs
+            langs = [lang for lang in languages.split(',') if lang]
+            ids = [tid for tid in translation_ids.split(',') if tid]
+            # zip() would silently drop the unmatched tail; record it instead
+            if len(langs) != len(ids):
+                mismatched_keys.append(key_id)
+            # Language codes repeat on every row; interning makes them share
+            # one str object (and its cached hash) across the whole table.
+            # Aliased codes are resolved here, once, instead of per lookup:
+            # 'tr' is stored under 'tr_TR', and a literal 'tr_TR' is ignored,
+            # as the enrichment always looked 'tr_TR' up as 'tr'.
+            for lang, trans_id in zip(langs, ids):
+                if lang in LANGUAGE_LOOKUP_ALIASES:
+                    continue
+                id_lookup[(key_id, sys.intern(lang))] = trans_id
+                for alias in _ALIASES_BY_LOOKUP_CODE.get(lang, ()):
+                    id_lookup[(key_id, alias)] = trans_id
+
+    return id_lookup, keys_count, mismatched_keys
+
 def load_translation_id_lookup():
     """
     Load all translation IDs into a lookup dictionary.
 
-    Creates a nested dictionary structure: {key_id: {lang_iso: translation_id}}
-    This allows O(1) lookup of translation IDs for any key-language combination.
+    Creates a flat dictionary keyed by (key_id, lang_iso) tuples, so each
+    key-language combination is resolved with a single dict probe.
+
+    The CSV is parsed with pyarrow when it is installed, otherwise with a
+    plain csv.reader (see _read_translation_id_rows).
 
     Returns:
-        Dict[str, Dict[str, str]]: Nested dictionary mapping key IDs to language-translation ID pairs
+        Dict[Tuple[str, str], str]: Dictionary mapping (key_id, lang_iso) to translation ID
 
     Raises:
         FileNotFoundError: If all_translation_ids.csv doesn't exist
@@ -92,22 +196,12 @@ def load_translation_id_lookup():
     if not ALL_TRANSLATION_IDS_FILE.exists():
         raise FileNotFoundError(f"File not found: {ALL_TRANSLATION_IDS_FILE}")
 
-    id_lookup = {}
-    delimiter = detect_csv_delimiter(ALL_TRANSLATION_IDS_FILE)
-    with ALL_TRANSLATION_IDS_FILE.open('r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile, delimiter=delimiter)
-        for row in reader:
-            key_id = row['key_id']
-            if key_id not in id_lookup:
-                id_lookup[key_id] = {}
-            
-            languages = [lang.strip() for lang in row.get('language_iso', '').split(',') if lang.strip()]
-            translation_ids = [tid.strip() for tid in row.get('translation_id', '').split(',') if tid.strip()]
-
-            # Create language → ID mapping for this key
-            id_lookup[key_id] = dict(zip(languages, translation_ids))
-                
-    print_colored(f"   Created lookup table for {len(id_lookup)} keys.", Fore.BLUE)
+    id_lookup, keys_count, mismatched_keys = _parse_translation_id_lookup()
+
+    if mismatched_keys:
+        sample = ", ".join(mismatched_keys[:MISSING_ID_SAMPLE_SIZE])
+        print_colored(f"   - WARNING: {len(mismatched_keys)} key(s) have a different number of languages and translation IDs; only matching pairs were used: {sample}", Fore.YELLOW)
+    print_colored(f"   Created lookup table for {keys_count} keys.", Fore.BLUE)
     return id_lookup
 
 def enrich_and_save_translations(id_lookup):
@@ -119,64 +213,86 @@ def enrich_and_save_translations(id_lookup):
     from the lookup table and adds it to the output.
 
     Args:
-        id_lookup: Dictionary mapping {key_id: {lang_iso: translation_id}}
+        id_lookup: Dictionary mapping {(key_id, lang_iso): translation_id}
 
     Raises:
         FileNotFoundError: If merged_translations_result.csv doesn't exist
 
     Note:
-        Turkish Hotfix: When the language is 'tr_TR', the function automatically
-        looks it up as 'tr' in the lookup table, as Lokalise stores Turkish with
-        the short code 'tr' but normalization uses 'tr_TR'.
+        Turkish Hotfix: Lokalise stores Turkish with the short code 'tr' but
+        normalization uses 'tr_TR'. The lookup table built by
+        load_translation_id_lookup() already holds 'tr' IDs under 'tr_TR', so
+        no remapping happens here. Further quirks of this kind go in
+        LANGUAGE_LOOKUP_ALIASES.
     """
     print_colored(f"\n-> Reading normalized data from '{MERGED_TRANSLATIONS_FILE.name}'...", Fore.BLUE)
     if not MERGED_TRANSLATIONS_FILE.exists():
          raise FileNotFoundError(f"Normalized file not found: {MERGED_TRANSLATIONS_FILE}")
 
-    delimiter = detect_csv_delimiter(MERGED_TRANSLATIONS_FILE)
-    with MERGED_TRANSLATIONS_FILE.open('r', encoding='utf-8') as infile:
-        rows_to_process = list(csv.DictReader(infile, delimiter=delimiter))
-    
-    print_colored(f"   Found {len(rows_to_process)} keys to prepare.", Fore.BLUE)
-    print_colored("\n-> Enriching records with translation IDs...", Fore.CYAN)
-    
-    output_rows = []
-    
-    for row in rows_to_process:
-        key_id = row['key_id']
-        key_name = row.get('key_name', 'N/A')
-        
-        languages_needed = [lang.strip() for lang in row['languages'].split(',') if lang.strip()]
-        final_translation_ids = []
-        
-        for lang in languages_needed:
-            # DEFINITIVE HOTFIX: Fix language code BEFORE lookup
-            # If language is 'tr_TR', look it up in the table as 'tr'
-            lookup_lang = 'tr' if lang == 'tr_TR' else lang
-
-            if key_id in id_lookup and lookup_lang in id_lookup[key_id]:
-                trans_id = id_lookup[key_id][lookup_lang]
+    delimiter = detect_csv_delimiter_cached(MERGED_TRANSLATIONS_FILE)
+    print_colored("-> Enriching records with translation IDs...", Fore.CYAN)
+
+    # Single pass: each row is read, enriched and written before the next one
+    # is parsed, so memory stays flat regardless of input size
+    keys_written = 0
+    missing_ids = []
+    with MERGED_TRANSLATIONS_FILE.open('r', encoding='utf-8', newline='') as infile, \
+            OUTPUT_FILE.open('w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as outfile:
+        reader = csv.reader(infile, delimiter=delimiter)
+        header = next(reader, None) or OUTPUT_FIELDNAMES
+        i_kid = header.index('key_id')
+        i_lang = header.index('languages')
+        i_tr = header.index('translation')
+        i_name = header.index('key_name') if 'key_name' in header else None
+
+        writer = csv.writer(outfile)
+        writer.writerow(OUTPUT_FIELDNAMES)
+        # Rows go out in batches through writerows() into the 1 MiB buffer
+        pending = []
+
+        for row in reader:
+            if not row:
+                continue
+            key_id = row[i_kid]
+            key_name = row[i_name] if i_name is not None else 'N/A'
+
+            languages_needed = [lang for lang in row[i_lang].replace(' ', '').split(',') if lang]
+            final_translation_ids = []
+
+            for lang in languages_needed:
+                # DEFINITIVE HOTFIX: aliases such as 'tr_TR' -> 'tr' are already
+                # folded into id_lookup, so the normalized code is used directly
+                trans_id = id_lookup.get((key_id, lang))
+                if trans_id is None:
+                    # This case shouldn't happen for Turkish anymore, but kept as safety net.
+                    # Collected and reported once after the loop.
+                    missing_ids.append((key_name, lang))
+                    trans_id = ''
                 final_translation_ids.append(trans_id)
-            else:
-                # This case shouldn't happen for Turkish anymore, but kept as safety net
-                print_colored(f"   - WARNING: No translation_id found for key '{key_name}' in language '{lang}'. Appending empty ID.", Fore.YELLOW)
-                final_translation_ids.append('')
-
-        # Prepare final output row
-        output_rows.append({
-            'key_name': key_name,
-            'key_id': key_id,
-            'languages': ','.join(languages_needed),
-            'translation_id': ','.join(final_translation_ids),
-            'translation': row['translation']
-        })
-
-    print_colored(f"\n-> Enrichment complete. Writing {len(output_rows)} keys to '{OUTPUT_FILE.name}'...", Fore.CYAN)
-    with OUTPUT_FILE.open('w', newline='', encoding='utf-8') as outfile:
-        fieldnames = ['key_name', 'key_id', 'languages', 'translation_id', 'translation']
-        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(output_rows)
+
+            pending.append((
+                key_name,
+                key_id,
+                ','.join(languages_needed),
+                ','.join(final_translation_ids),
+                row[i_tr]
+            ))
+            if len(pending) >= CSV_WRITE_BATCH_SIZE:
+                writer.writerows(pending)
+                keys_written += len(pending)
+                pending.clear()
+
+        writer.writerows(pending)
+        keys_written += len(pending)
+
+    if missing_ids:
+        sample = ", ".join(f"'{name}' ({lang})" for name, lang in missing_ids[:MISSING_ID_SAMPLE_SIZE])
+        more = len(missing_ids) - MISSING_ID_SAMPLE_SIZE
+        if more > 0:
+            sample += f" and {more} more"
+        print_colored(f"   - WARNING: No translation_id found for {len(missing_ids)} key/language pair(s); empty IDs appended: {sample}", Fore.YELLOW)
+
+    print_colored(f"\n-> Enrichment complete. Wrote {keys_written} keys to '{OUTPUT_FILE.name}'.", Fore.CYAN)
 
 def main():
     try:
@@ -21,6 +21,7 @@ Features:
     - Batch upload with progress tracking
     - Success and failure reports
     - Data validation before upload
+    - Reruns of the same input skip translations a failed run already uploaded (--no-cache to force)
     - Colorama/tabulate support for enhanced output
 
 API Details:
@@ -37,6 +38,8 @@ Input Files:
 Output Files:
     - reports/final_report.csv: Successfully uploaded translations
     - reports/failed_update.csv: Failed uploads (only if errors occur)
+    - reports/.upload_cache.sqlite3: Translations uploaded from the current input
+      (kept only until a run of it finishes without failures)
 
 CSV Format (translation_done.csv):
     key_name,key_id,languages,translation_id,translated
@@ -47,7 +50,7 @@ Report Format (final_report.csv):
     123,ms_test_1,it,456,Ciao,2024-01-15T10:30:00Z
 
 Usage:
-    python3 -m lokalise_translation_manager.utils.upload_translations
+    python3 -m lokalise_translation_manager.utils.upload_translations [--no-cache]
 
     Or import:
         from lokalise_translation_manager.utils.upload_translations import main
@@ -55,15 +58,17 @@ Usage:
 
 Example Output:
     INFO: Using detected CSV delimiter: ','
-    Found 50 keys with new translations to upload.
     Updating 'ms_test_1' in 'it'...
     Updating 'ms_test_1' in 'de'...
     ...
+    Processed 50 keys with new translations.
     ✅ Uploaded translations. Report saved to: reports/final_report.csv
 
     ===== UPLOAD SUMMARY =====
     Total API Requests: 150
     Successful Updates: 148
+    Skipped (Already Uploaded): 0
+    Duplicates Skipped: 0
     Failed/Skipped Updates: 2
 
 Error Handling:
@@ -72,17 +77,28 @@ Error Handling:
     - Data mismatch: Skips row and logs error
     - Missing translation_id: Skips translation
     - API errors: Logs failure and continues
+    - Rejected API token (401/403) or unknown project (404): Aborts the upload
     - All errors tracked in failed_update.csv
 """
 
 import os
 import csv
+import hashlib
+import itertools
 import json
+import random
 import requests
+import sqlite3
+import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
-from .csv_utils import detect_csv_delimiter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from .csv_utils import LazyCsvWriter, detect_csv_delimiter_cached
 
 try:
     from colorama import init, Fore, Style
@@ -93,6 +109,11 @@ except ImportError:
     colorama_available = False
     tabulate = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Paths
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 CONFIG_PATH = BASE_DIR / "config" / "user_config.json"
@@ -100,8 +121,29 @@ REPORTS_DIR = BASE_DIR / "reports"
 TRANSLATION_DONE_FILE = REPORTS_DIR / "translation_done.csv"
 FINAL_REPORT_FILE = REPORTS_DIR / "final_report.csv"
 FAILED_UPDATE_FILE = REPORTS_DIR / "failed_update.csv"
+UPLOAD_CACHE_FILE = REPORTS_DIR / ".upload_cache.sqlite3"
+
+# Report columns; rows are written as task tuples plus the result column
+REPORT_FIELDS = ['key_id', 'key_name', 'language_iso', 'translation_id', 'new_translation', 'modified_at']
+FAILED_FIELDS = ['key_id', 'key_name', 'language_iso', 'translation_id', 'new_translation', 'status_code']
+REPORT_FLUSH_ROWS = 64  # Report rows buffered before being flushed to disk
 
 RATE_LIMIT = 6  # Lokalise allows ~6 req/sec with free plan
+UPLOAD_WORKERS = RATE_LIMIT  # Concurrent in-flight PUT requests
+UPLOAD_QUEUE_SIZE = UPLOAD_WORKERS * 4  # Tasks read ahead of the uploads
+LOG_FLUSH_LINES = 32  # Buffered progress lines printed in one write...
+LOG_FLUSH_INTERVAL = 0.25  # ...or after this many seconds, whichever comes first
+MAX_RATE_LIMIT_RETRIES = 3  # Re-sends of a translation rejected with 429
+AUTH_FAILURE_STATUSES = (401, 403)  # Token rejected: every later request would fail too
+# Transient failures re-sent by _send_put() through the rate limiter
+RETRY_STATUSES = (408, 425, 500, 502, 503, 504)
+MAX_RETRIES = 3  # Re-sends after a RETRY_STATUSES response or a connection/read error
+RETRY_BACKOFF = 1.0  # Seconds before the first re-send, doubling for each one after...
+RETRY_BACKOFF_MAX = 30.0  # ...up to this cap
+RETRY_JITTER = 0.5  # Random extra delay, in seconds, added to each backoff
+
+# Shared keep-alive session, created on first use by get_session()
+_SESSION: Optional[requests.Session] = None
 
 def print_colored(text: str, color=None) -> None:
     """
@@ -114,20 +156,64 @@ def print_colored(text: str, color=None) -> None:
     Note:
         If colorama is not available, prints plain text without colors.
     """
+    print(_colored(text, color))
+
+def _colored(text: str, color=None) -> str:
+    """Return text wrapped in the given color, or unchanged without colorama."""
     if colorama_available:
-        print(color + text + Style.RESET_ALL)
-    else:
-        print(text)
+        return color + text + Style.RESET_ALL
+    return text
 
+class LogBuffer:
+    """
+    Thread-safe buffer for per-translation progress lines.
+
+    Upload workers and the result loop add a line for every translation;
+    printing each one separately makes console I/O a noticeable cost on fast
+    connections. Lines are collected and written with a single print() once
+    LOG_FLUSH_LINES are pending or LOG_FLUSH_INTERVAL seconds have passed
+    since the last write. Call flush() before printing anything else.
+    """
+
+    def __init__(self, max_lines: int = LOG_FLUSH_LINES, interval: float = LOG_FLUSH_INTERVAL):
+        self._max_lines = max_lines
+        self._interval = interval
+        self._lines = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def add(self, text: str, color=None) -> None:
+        """Queue a colored line, flushing if the batch is full or stale."""
+        with self._lock:
+            self._lines.append(_colored(text, color))
+            if len(self._lines) >= self._max_lines or time.monotonic() - self._last_flush >= self._interval:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Print every pending line now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._lines:
+            print("\n".join(self._lines))
+            self._lines.clear()
+        self._last_flush = time.monotonic()
+
+@lru_cache(maxsize=1)
 def load_lokalise_config() -> Tuple[str, str]:
     """
     Load Lokalise API credentials from config file.
 
+    The file is read once per process; later calls return the cached pair.
+    Use load_lokalise_config.cache_clear() to pick up an edited config.
+
     Returns:
         Tuple[str, str]: (project_id, api_key)
 
     Raises:
         FileNotFoundError: If config file doesn't exist or is misconfigured
+                           (not cached, so a retry re-reads the file)
 
     Example Config Format:
         {
@@ -143,7 +229,340 @@ def load_lokalise_config() -> Tuple[str, str]:
             return config["lokalise"]["project_id"], config["lokalise"]["api_key"]
     raise FileNotFoundError("user_config.json not found or misconfigured.")
 
-def update_translations() -> None:
+def _json_dumps(obj) -> bytes:
+    """Serialize a request body to UTF-8 JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _json_loads(data: bytes):
+    """Parse a response body with orjson when available, else the stdlib json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def get_session(api_key: str) -> requests.Session:
+    """
+    Return the module-wide requests.Session used for Lokalise uploads.
+
+    All PUTs reuse its pooled keep-alive connections to api.lokalise.com
+    instead of paying a TCP + TLS handshake per request.
+
+    Args:
+        api_key: Lokalise API token, sent as a default header
+
+    Returns:
+        requests.Session: Session with JSON + auth headers
+
+    Note:
+        - Connection pool sized for UPLOAD_WORKERS concurrent requests
+        - The adapter does not retry: every re-send goes through _send_put(),
+          so it takes a RateLimiter permit and is counted like any request
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=UPLOAD_WORKERS))
+    _SESSION.headers.update({
+        "accept": "application/json",
+        "content-type": "application/json",
+        "X-Api-Token": api_key
+    })
+    return _SESSION
+
+class UploadCache:
+    """
+    Record of translations uploaded from one translation_done.csv, across runs.
+
+    Entries map (translation_id, SHA-1 of the text) to the modified_at that
+    Lokalise returned. A rerun after a partial failure looks each task up
+    and only sends the ones that have not gone through with that exact
+    text. Only successful uploads are recorded; failures are always retried.
+
+    The cache belongs to the input it was filled from: opening it with a
+    different input signature (see _file_signature()) empties it, so a new
+    translation_done.csv is always uploaded in full. update_translations()
+    also deletes it after a run without transient failures (_is_transient()).
+    Then nothing is left that a rerun of the same file could fix, and values
+    edited in Lokalise since are not masked by a stale entry. Permanent
+    failures, such as unknown translation IDs, need an edited input file,
+    which starts a new cache anyway.
+
+    Backed by a stdlib sqlite3 database. Use it from a single thread;
+    inserts are committed every REPORT_FLUSH_ROWS rows and on close().
+    """
+
+    def __init__(self, path: Path, input_signature: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("CREATE TABLE IF NOT EXISTS uploaded (key TEXT PRIMARY KEY, modified_at TEXT)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'input'").fetchone()
+        if row is None or row[0] != input_signature:
+            # Entries from another input say nothing about this one
+            self._db.execute("DELETE FROM uploaded")
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('input', ?)", (input_signature,))
+            self._db.commit()
+        self._pending = 0
+
+    @staticmethod
+    def _key(trans_id: str, translation: str) -> str:
+        return f"{trans_id}:{hashlib.sha1(translation.encode('utf-8')).hexdigest()}"
+
+    def get(self, trans_id: str, translation: str) -> Optional[str]:
+        """Return the modified_at of an earlier upload of this text, or None."""
+        row = self._db.execute("SELECT modified_at FROM uploaded WHERE key = ?",
+                               (self._key(trans_id, translation),)).fetchone()
+        return row[0] if row else None
+
+    def add(self, trans_id: str, translation: str, modified_at: str) -> None:
+        """Record a successful upload."""
+        self._db.execute("INSERT OR REPLACE INTO uploaded VALUES (?, ?)",
+                         (self._key(trans_id, translation), modified_at))
+        self._pending += 1
+        if self._pending >= REPORT_FLUSH_ROWS:
+            self._db.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Commit pending entries and close the database."""
+        self._db.commit()
+        self._db.close()
+
+class RateLimiter:
+    """
+    Thread-safe limiter allowing at most `rate` requests in any one-second window.
+
+    Each acquire() takes a permit that is handed back one second later, so
+    the budget slides with time instead of resetting on fixed ticks. The
+    server can additionally pause all callers via pause(), e.g. when it
+    reports an exhausted quota or answers 429 with Retry-After.
+    """
+
+    def __init__(self, rate: int):
+        self._permits = threading.BoundedSemaphore(rate)
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                wait = self._resume_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+                continue
+
+            self._permits.acquire()
+            with self._lock:
+                paused = self._resume_at > time.monotonic()
+            if paused:
+                # A pause started while we were blocked; hand the permit back
+                self._permits.release()
+                continue
+
+            release = threading.Timer(1.0, self._permits.release)
+            release.daemon = True
+            release.start()
+            return
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for at least `seconds` from now."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+def _file_signature(path: Path) -> str:
+    """Return a "mtime_ns:size" signature that changes whenever `path` is rewritten."""
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+def _is_transient(status_code) -> bool:
+    """
+    Return True if a failed upload may succeed when simply sent again.
+
+    Network errors (status_code is the exception name), 429 and
+    RETRY_STATUSES are transient; other 4xx answers and invalid rows are not.
+    """
+    return not isinstance(status_code, int) or status_code == 429 or status_code in RETRY_STATUSES
+
+def _retry_after_seconds(response: requests.Response, default: float = 1.0) -> float:
+    """Return the response's Retry-After delay in seconds, or `default` if absent/unparsable."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", default)))
+    except (TypeError, ValueError):
+        return default
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the exponential backoff, with up to RETRY_JITTER extra, before re-send number `attempt`."""
+    return min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2 ** (attempt - 1)) * (1 + random.uniform(0, RETRY_JITTER))
+
+def _auth_failure_message(status_code: int) -> str:
+    """Return the error raised when Lokalise rejects the API token."""
+    return (f"Authentication failed ({status_code}); aborting upload. "
+            f"Check the Lokalise api_key in {CONFIG_PATH.name}.")
+
+def _check_project(session: requests.Session, limiter: RateLimiter, project_url: str) -> None:
+    """
+    Fail fast if the API token or project ID is wrong, before any upload.
+
+    One GET of the project costs a single request; without it a bad token
+    or project ID would fail every translation in the file, one by one.
+
+    Raises:
+        RuntimeError: On AUTH_FAILURE_STATUSES or 404
+
+    Note:
+        Network errors are ignored here; the uploads report them per row.
+    """
+    limiter.acquire()
+    try:
+        response = session.get(project_url)
+    except requests.RequestException:
+        return
+    if response.status_code in AUTH_FAILURE_STATUSES:
+        raise RuntimeError(_auth_failure_message(response.status_code))
+    if response.status_code == 404:
+        raise RuntimeError(f"Lokalise project not found (404); aborting upload. "
+                           f"Check the Lokalise project_id in {CONFIG_PATH.name}.")
+
+def _send_put(session: requests.Session, limiter: RateLimiter,
+              url: str, payload: bytes) -> Tuple[Optional[requests.Response], Optional[str], int]:
+    """
+    PUT an encoded JSON body within the shared rate limit.
+
+    Returns:
+        Tuple: (response, error, requests_sent). response is None and error
+        holds the exception name if the request could not be sent.
+
+    Raises:
+        RuntimeError: If Lokalise rejects the API token (AUTH_FAILURE_STATUSES)
+
+    Note:
+        - X-RateLimit-Remaining: 0 pauses all workers for Retry-After (default 1s)
+        - 429 responses pause all workers for Retry-After (without one, an
+          exponential backoff with jitter) and the same body is re-sent,
+          up to MAX_RATE_LIMIT_RETRIES times
+        - RETRY_STATUSES responses do the same, up to MAX_RETRIES times, so
+          a burst of 5xx answers slows every worker down
+        - Connection and read errors back off this worker alone and are
+          re-sent up to MAX_RETRIES times
+        - Every re-send takes a RateLimiter permit and is counted
+    """
+    attempts = 0
+    while True:
+        limiter.acquire()
+        attempts += 1
+        try:
+            response = session.put(url, data=payload)
+        except requests.RequestException as e:
+            if attempts <= MAX_RETRIES:
+                time.sleep(_backoff_delay(attempts))
+                continue
+            return None, type(e).__name__, attempts
+
+        if response.status_code in AUTH_FAILURE_STATUSES:
+            raise RuntimeError(_auth_failure_message(response.status_code))
+        if response.status_code == 429 and attempts <= MAX_RATE_LIMIT_RETRIES:
+            limiter.pause(_retry_after_seconds(response, _backoff_delay(attempts)))
+            continue
+        if response.status_code in RETRY_STATUSES and attempts <= MAX_RETRIES:
+            limiter.pause(_retry_after_seconds(response, _backoff_delay(attempts)))
+            continue
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            limiter.pause(_retry_after_seconds(response))
+        return response, None, attempts
+
+def _upload_one(session: requests.Session, limiter: RateLimiter, log: LogBuffer,
+                url_prefix: str, task: Tuple[str, str, str, str, str]) -> Tuple[Tuple[str, str, str, str, str], object, Optional[str], int]:
+    """
+    Upload a single translation within the shared rate limit.
+
+    Args:
+        session: Shared HTTP session from get_session()
+        limiter: Rate limiter shared by all upload workers
+        log: Progress log shared by all upload workers
+        url_prefix: Project translations endpoint ending in '/', see update_translations()
+        task: (key_id, key_name, language_iso, translation_id, translation)
+
+    Returns:
+        Tuple: (task, status_code, modified_at, requests_sent). modified_at is
+        None unless the update succeeded; status_code is the exception name
+        if the request could not be sent.
+
+    Note:
+        - Rate limiting and retries are handled by _send_put()
+        - Bodies are encoded/decoded with orjson when it is installed
+    """
+    key_id, key_name, lang, trans_id, translation = task
+    log.add(f"Updating '{key_name}' in '{lang}'...", Fore.BLUE)
+
+    # Encoded once, not on every retry; content-type is set on the session
+    payload = _json_dumps({"translation": translation})
+    response, error, attempts = _send_put(session, limiter, url_prefix + trans_id, payload)
+
+    if response is None:
+        return task, error, None, attempts
+    if response.status_code == 200:
+        return task, 200, _json_loads(response.content)['translation']['modified_at'], attempts
+    return task, response.status_code, None, attempts
+
+def _split_row(row: Dict[str, str]) -> Tuple[List[str], List[str], List[str]]:
+    """Split a translation_done.csv row into its languages, translation IDs and texts."""
+    # Codes and IDs never contain spaces, so dropping them up front
+    # replaces a strip() per element
+    return (row['languages'].replace(' ', '').split(','),
+            row['translation_id'].replace(' ', '').split(','),
+            [t.strip() for t in row['translated'].split('|')])
+
+def _last_updates(rows: Iterable[Dict[str, str]]) -> Dict[str, int]:
+    """
+    Map every translation ID to the position of its last occurrence.
+
+    Positions number the cells of rows whose cell counts match, in file
+    order and starting at 1, as iter_tasks() in update_translations() does.
+    A translation ID that appears more than once is only uploaded from its
+    last occurrence, so the last row wins as it would with sequential
+    uploads.
+    """
+    last: Dict[str, int] = {}
+    position = 0
+    for row in rows:
+        languages, translation_ids, translations = _split_row(row)
+        if not (len(languages) == len(translation_ids) == len(translations)):
+            continue
+        for trans_id in translation_ids:
+            position += 1
+            if trans_id:
+                last[trans_id] = position
+    return last
+
+def _map_bounded(executor: Executor, fn: Callable, items: Iterable, window: int) -> Iterator:
+    """
+    Like executor.map(fn, items), but with at most `window` items in flight.
+
+    executor.map() drains its whole input up front, which would read all of
+    translation_done.csv into memory before the first upload finishes. Here
+    the input is consumed only as results are taken, so the queued tasks stay
+    bounded by the window rather than the file size. Results keep the input
+    order.
+
+    If a call raises, the exception is re-raised here and the queued calls
+    that have not started yet are cancelled.
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+def update_translations(project_id: Optional[str] = None, api_key: Optional[str] = None,
+                        use_cache: bool = True) -> None:
     """
     Upload completed translations to Lokalise via API.
 
@@ -157,6 +576,13 @@ def update_translations() -> None:
     7. Generates final_report.csv (successes) and failed_update.csv (failures)
     8. Displays summary statistics
 
+    Args:
+        project_id: Lokalise project ID (default: from load_lokalise_config())
+        api_key: Lokalise API token (default: from load_lokalise_config())
+        use_cache: Skip translations whose exact text an earlier, unfinished
+                   run of the same translation_done.csv already uploaded
+                   (UploadCache); False re-sends everything
+
     Input File Format (translation_done.csv):
         key_name,key_id,languages,translation_id,translated
         ms_test,123,"it,de,fr","456,789,012","Ciao|Hallo|Bonjour"
@@ -164,40 +590,76 @@ def update_translations() -> None:
     Output Files:
         - final_report.csv: Successfully uploaded translations with timestamps
         - failed_update.csv: Failed uploads with status codes (only if errors)
+        Both are written row by row while the upload runs, and only created
+        once they have a row. Rows go to a '.tmp' sibling that replaces the
+        report when the upload ends.
 
     API Request:
         PUT /api2/projects/{project_id}/translations/{translation_id}
-        Headers: X-Api-Token: {api_key}
+        Headers: X-Api-Token: {api_key} (set once on the shared session)
         Payload: {"translation": "translated text"}
 
     Rate Limiting:
         - 6 requests per second maximum
-        - Automatic sleep(1) after every 6 requests
+        - Up to UPLOAD_WORKERS requests in flight at once, and at most
+          RATE_LIMIT sent in any one-second window (RateLimiter)
+        - Server feedback wins: X-RateLimit-Remaining: 0 and 429 responses
+          pause all workers for Retry-After seconds; 429s are retried
+        - Transient errors (RETRY_STATUSES, connection and read errors) are
+          re-sent up to MAX_RETRIES times, each re-send within the rate limit
 
     Error Handling:
         - Missing file: Exits with error
         - Empty file: Exits with info
         - Data mismatch: Skips row and logs
         - Missing translation_id: Skips and logs
+        - Repeated translation_id: Only its last occurrence is uploaded, so
+          the last row wins; earlier ones are logged and counted as duplicates
+        - Text already uploaded by an earlier run of the same input file:
+          Reported from the cache, not re-sent (unless use_cache=False).
+          The cache is only kept after a run with transient failures
+          (network errors, 429, RETRY_STATUSES), which a rerun can fix
         - API errors: Logs failure and continues
+        - Rejected API token (401/403): Aborts at the first such response,
+          which the project check before the upload usually is
+        - Unknown project (404 on the project check): Aborts before uploading
+
+    Memory:
+        The upload itself streams translation_done.csv: rows are parsed as
+        upload slots free up (UPLOAD_QUEUE_SIZE tasks ahead at most). Before
+        it, a first pass reads the whole file once to find where each
+        translation ID is last updated (_last_updates()). That index holds
+        one entry per translation ID, so memory grows with the number of
+        IDs, though not with the texts; this is the price of last-wins
+        uploads on a concurrent pool.
+
+    Console Output:
+        Per-translation lines ("Updating ...", failures, skipped rows) go
+        through a LogBuffer and are printed in batches.
 
     Example Output:
-        Found 50 keys with new translations to upload.
         Updating 'ms_test_1' in 'it'...
+        Processed 50 keys with new translations.
         ✅ Uploaded translations. Report saved to: reports/final_report.csv
 
         ===== UPLOAD SUMMARY =====
         Total API Requests: 150
         Successful Updates: 148
+        Skipped (Already Uploaded): 0
+        Duplicates Skipped: 0
         Failed/Skipped Updates: 2
     """
-    project_id, api_key = load_lokalise_config()
+    if project_id is None or api_key is None:
+        project_id, api_key = load_lokalise_config()
 
-    report_data = []
-    failed_data = []
     request_count = 0
+    cached_count = 0
+    duplicate_count = 0
     success_count = 0
     failure_count = 0
+    transient_count = 0
+    keys_count = 0
+    log = LogBuffer()
 
     try:
         if not TRANSLATION_DONE_FILE.exists():
@@ -205,90 +667,123 @@ def update_translations() -> None:
             return
 
         # Automatic CSV delimiter detection
-        delimiter = detect_csv_delimiter(TRANSLATION_DONE_FILE)
+        delimiter = detect_csv_delimiter_cached(TRANSLATION_DONE_FILE)
         print_colored(f"INFO: Using detected CSV delimiter: '{delimiter}'", Fore.YELLOW)
 
+        # Where each translation ID is last updated; earlier occurrences are
+        # not sent, so concurrent uploads cannot race on the stored text
         with TRANSLATION_DONE_FILE.open('r', encoding='utf-8') as infile:
-            reader = list(csv.DictReader(infile, delimiter=delimiter))
-
-        if not reader:
-            print_colored(f"INFO: Input file '{TRANSLATION_DONE_FILE.name}' is empty. Nothing to upload.", Fore.YELLOW)
-            return
-            
-        print_colored(f"Found {len(reader)} keys with new translations to upload.", Fore.CYAN)
-
-        for row in reader:
-            key_name = row['key_name']
-            key_id = row['key_id']
-            languages = row['languages'].split(',')
-            translation_ids = row['translation_id'].split(',')
-            translations = row['translated'].split('|')
-
-            if not (len(languages) == len(translation_ids) == len(translations)):
-                print_colored(f"\nFATAL DATA MISMATCH for key '{key_name}' ({key_id}). Skipping this row.", Fore.RED)
-                print_colored(f"  - Found: {len(languages)} languages, {len(translation_ids)} IDs, {len(translations)} translations.", Fore.RED)
-                failure_count += len(languages)
-                continue
-
-            for lang, trans_id, translation in zip(languages, translation_ids, translations):
-                lang = lang.strip()
-                trans_id = trans_id.strip()
-                translation = translation.strip()
-
-                if not trans_id:
-                    print_colored(f"Skipping update for '{key_name}' in '{lang}' because its Translation ID is missing.", Fore.YELLOW)
-                    failure_count += 1
+            reader = csv.DictReader(infile, delimiter=delimiter)
+            first_row = next(reader, None)
+            if first_row is None:
+                # Checked before the project check: an empty file needs no API call
+                print_colored(f"INFO: Input file '{TRANSLATION_DONE_FILE.name}' is empty. Nothing to upload.", Fore.YELLOW)
+                return
+            last_updates = _last_updates(itertools.chain((first_row,), reader))
+
+        def iter_tasks(reader):
+            """Validate rows and yield one upload task per (key, language)."""
+            nonlocal failure_count, keys_count, success_count, cached_count, duplicate_count
+            position = 0
+            for row in reader:
+                keys_count += 1
+                key_name = row['key_name']
+                key_id = row['key_id']
+                languages, translation_ids, translations = _split_row(row)
+
+                if not (len(languages) == len(translation_ids) == len(translations)):
+                    log.add(f"\nFATAL DATA MISMATCH for key '{key_name}' ({key_id}). Skipping this row.", Fore.RED)
+                    log.add(f"  - Found: {len(languages)} languages, {len(translation_ids)} IDs, {len(translations)} translations.", Fore.RED)
+                    failure_count += len(languages)
                     continue
 
-                print_colored(f"Updating '{key_name}' in '{lang}'...", Fore.BLUE)
-
-                url = f"https://api.lokalise.com/api2/projects/{project_id}/translations/{trans_id}"
-                headers = {
-                    "accept": "application/json",
-                    "content-type": "application/json",
-                    "X-Api-Token": api_key
-                }
-                payload = {"translation": translation}
-
-                response = requests.put(url, headers=headers, json=payload)
-                request_count += 1
-
-                if request_count % RATE_LIMIT == 0:
-                    time.sleep(1)
-
-                if response.status_code == 200:
-                    success_count += 1
-                    mod_time = response.json()['translation']['modified_at']
-                    report_data.append({
-                        'key_id': key_id, 'key_name': key_name, 'language_iso': lang,
-                        'translation_id': trans_id, 'new_translation': translation, 'modified_at': mod_time
-                    })
-                else:
-                    failure_count += 1
-                    print_colored(f"Failed to update '{key_name}' ({lang}) — Status: {response.status_code}", Fore.RED)
-                    failed_data.append({
-                        'key_id': key_id, 'key_name': key_name, 'language_iso': lang,
-                        'translation_id': trans_id, 'new_translation': translation, 'status_code': response.status_code
-                    })
-
-        if report_data:
-            with FINAL_REPORT_FILE.open('w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=report_data[0].keys())
-                writer.writeheader()
-                writer.writerows(report_data)
+                for lang, trans_id, translation in zip(languages, translation_ids, translations):
+                    position += 1
+                    if not trans_id:
+                        log.add(f"Skipping update for '{key_name}' in '{lang}' because its Translation ID is missing.", Fore.YELLOW)
+                        failure_count += 1
+                        continue
+
+                    if last_updates[trans_id] != position:
+                        log.add(f"Skipping '{key_name}' in '{lang}': a later row updates it again, and only its text is sent.", Fore.YELLOW)
+                        duplicate_count += 1
+                        continue
+
+                    task = (key_id, key_name, lang, trans_id, translation)
+                    mod_time = cache.get(trans_id, translation) if cache else None
+                    if mod_time is not None:
+                        log.add(f"Skipping '{key_name}' in '{lang}' (already uploaded by an earlier run).", Fore.YELLOW)
+                        cached_count += 1
+                        success_count += 1
+                        report_writer.writerow(task + (mod_time,))
+                        continue
+
+                    yield task
+
+        # Upload concurrently; the rate limiter, not request latency,
+        # bounds throughput at RATE_LIMIT requests per second
+        limiter = RateLimiter(RATE_LIMIT)
+        session = get_session(api_key)
+        # Only the translation ID varies between requests
+        project_url = f"https://api.lokalise.com/api2/projects/{project_id}"
+        url_prefix = project_url + "/translations/"
+        _check_project(session, limiter, project_url)
+        request_count += 1
+        # Report rows are written as results arrive, so memory stays flat.
+        # Each report is only created once it has a row to hold. Rows go to a
+        # '.tmp' file, flushed every REPORT_FLUSH_ROWS rows, that replaces the
+        # report when the upload ends: a killed run leaves the previous
+        # report intact and what it uploaded in the '.tmp' file.
+        report_writer = LazyCsvWriter(FINAL_REPORT_FILE, REPORT_FIELDS, flush_every=REPORT_FLUSH_ROWS, atomic=True)
+        failed_writer = LazyCsvWriter(FAILED_UPDATE_FILE, FAILED_FIELDS, flush_every=REPORT_FLUSH_ROWS, atomic=True)
+        cache = UploadCache(UPLOAD_CACHE_FILE, _file_signature(TRANSLATION_DONE_FILE)) if use_cache else None
+        with TRANSLATION_DONE_FILE.open('r', encoding='utf-8') as infile, \
+                ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            try:
+                results = _map_bounded(
+                    executor,
+                    lambda task: _upload_one(session, limiter, log, url_prefix, task),
+                    iter_tasks(csv.DictReader(infile, delimiter=delimiter)),
+                    UPLOAD_QUEUE_SIZE
+                )
+                # Results arrive in input order and are recorded on this thread
+                for task, status_code, mod_time, sent in results:
+                    request_count += sent
+                    if mod_time is not None:
+                        success_count += 1
+                        report_writer.writerow(task + (mod_time,))
+                        if cache:
+                            cache.add(task[3], task[4], mod_time)
+                    else:
+                        failure_count += 1
+                        transient_count += _is_transient(status_code)
+                        log.add(f"Failed to update '{task[1]}' ({task[2]}) — Status: {status_code}", Fore.RED)
+                        failed_writer.writerow(task + (status_code,))
+            finally:
+                report_writer.close()
+                failed_writer.close()
+                if cache:
+                    cache.close()
+        log.flush()
+
+        if cache and not transient_count:
+            # Nothing a rerun of this file could fix; start from a clean slate
+            UPLOAD_CACHE_FILE.unlink(missing_ok=True)
+
+        print_colored(f"Processed {keys_count} keys with new translations.", Fore.CYAN)
+
+        if report_writer.opened:
             print_colored(f"\n✅ Uploaded translations. Report saved to: {FINAL_REPORT_FILE}", Fore.GREEN)
 
-        if failed_data:
-            with FAILED_UPDATE_FILE.open('w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=failed_data[0].keys())
-                writer.writeheader()
-                writer.writerows(failed_data)
+        if failed_writer.opened:
             print_colored(f"\nSome translations failed. See: {FAILED_UPDATE_FILE}", Fore.RED)
 
         print_colored("\n===== UPLOAD SUMMARY =====", Fore.MAGENTA)
         summary = [
             ["Total API Requests", request_count],
             ["Successful Updates", success_count],
+            ["Skipped (Already Uploaded)", cached_count],
+            ["Duplicates Skipped", duplicate_count],
             ["Failed/Skipped Updates", failure_count],
         ]
         if tabulate:
@@ -298,23 +793,34 @@ def update_translations() -> None:
                 print(f"{label}: {count}")
 
     except Exception as e:
+        log.flush()
         print_colored(f"\n❌ An unexpected error occurred: {e}", Fore.RED)
 
-def main() -> None:
+def main(use_cache: bool = True) -> None:
     """
     Main entry point for the upload translations module.
 
-    Displays header message and executes the upload workflow.
+    Loads the Lokalise credentials first, so a missing or broken
+    user_config.json fails before any file is read, then displays the
+    header message and executes the upload workflow.
+
+    Args:
+        use_cache: See update_translations(). Run as a script, --no-cache
+                   sets it to False, re-sending translations that an
+                   unfinished run of the same file uploaded
 
     Usage:
-        python3 -m lokalise_translation_manager.utils.upload_translations
+        python3 -m lokalise_translation_manager.utils.upload_translations [--no-cache]
 
         Or:
         from lokalise_translation_manager.utils.upload_translations import main
         main()
     """
+    project_id, api_key = load_lokalise_config()
     print_colored("Uploading translations to Lokalise...", Fore.CYAN)
-    update_translations()
+    update_translations(project_id, api_key, use_cache=use_cache)
 
 if __name__ == "__main__":
-    main()
+    # Only read argv when run as a script: core.run_tool() calls main()
+    # in-process, where sys.argv holds the tool's own arguments
+    main(use_cache="--no-cache" not in sys.argv[1:])
@@ -14,7 +14,8 @@ Features:
 
 Workflow:
     1. Check standard libraries availability
-    2. Install dependencies from requirements.txt (preferred)
+    2. Install dependencies from requirements.txt (preferred; pip only runs
+       for requirements that the installed packages do not satisfy)
     3. Fall back to manual installation if requirements.txt fails
     4. Create or validate user_config.json
     5. Launch core translation workflow
@@ -80,14 +81,26 @@ Exit Conditions:
 """
 
 import os
+import importlib.metadata
+import importlib.util
+import re
 import subprocess
 import sys
 import json
 from pathlib import Path
+from typing import List, Optional
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:
+    Requirement = None
 
 ROOT_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(ROOT_DIR))
 
+# Written after a successful requirements install; see install_from_requirements()
+DEPS_SENTINEL = ROOT_DIR / ".deps_ok"
+
 standard_libraries = [
     'os', 're', 'csv', 'time', 'threading', 'subprocess',
     'json', 'configparser', 'itertools'
@@ -100,6 +113,22 @@ optional_libraries = [
     'requests'
 ]
 
+def find_missing_modules(modules: List[str]) -> List[str]:
+    """
+    Return the modules that cannot be found, without importing any of them.
+
+    Args:
+        modules: Top-level module names (e.g., 'colorama', 'requests')
+
+    Returns:
+        List[str]: Names whose import spec cannot be located, in input order
+
+    Note:
+        importlib.util.find_spec() only locates the module, so heavy
+        packages are not loaded and their import-time side effects don't run.
+    """
+    return [name for name in modules if importlib.util.find_spec(name) is None]
+
 def install_package(package: str) -> None:
     """
     Install a single Python package using pip.
@@ -124,6 +153,98 @@ def install_package(package: str) -> None:
     except subprocess.CalledProcessError:
         print(f"✘ Failed to install: {package}")
 
+def install_packages(packages: List[str]) -> None:
+    """
+    Install Python packages with a single pip invocation.
+
+    Args:
+        packages: Names of the packages to install (e.g., ['colorama', 'requests'])
+
+    Note:
+        - Installs silently (stdout/stderr redirected to DEVNULL)
+        - One pip run for all packages, so pip's startup is paid once
+        - pip installs all of them or none, so if that run fails, each
+          package is retried on its own (install_package()): the others
+          still get installed, and the failing one is named
+        - Prints success or failure messages
+        - Does not raise exception on failure
+
+    Example:
+        install_packages(['prettytable', 'tqdm'])
+        # Output: ✔ Installed missing libraries: prettytable, tqdm
+    """
+    try:
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install', *packages],
+                              stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL)
+        print(f"✔ Installed missing libraries: {', '.join(packages)}")
+        return
+    except subprocess.CalledProcessError:
+        pass
+
+    for package in packages:
+        install_package(package)
+
+def find_unsatisfied_requirements(requirements_file: Path) -> Optional[List[str]]:
+    """
+    Return the requirements that the installed packages do not satisfy.
+
+    Installed versions are read with importlib.metadata, which is much
+    faster than starting pip just to hear "Requirement already satisfied".
+
+    Args:
+        requirements_file: pip requirements file to check
+
+    Returns:
+        Optional[List[str]]: Unsatisfied requirement lines, in file order
+        (empty if everything is installed), or None if a line could not be
+        checked here (pip options, URLs, ...) and pip should decide
+
+    Note:
+        Uses `packaging` for full specifier and marker support when it is
+        installed; without it only plain 'name' and 'name==version' lines
+        are understood.
+    """
+    unsatisfied = []
+    for line in requirements_file.read_text(encoding='utf-8').splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+
+        if Requirement is not None:
+            try:
+                req = Requirement(line)
+            except InvalidRequirement:
+                return None
+            if req.url:
+                return None
+            if req.marker is not None and not req.marker.evaluate():
+                continue
+            name, satisfied = req.name, req.specifier.contains
+        else:
+            match = re.fullmatch(r'([A-Za-z0-9._-]+)\s*(?:==\s*(\S+))?', line)
+            if not match:
+                return None
+            name, pinned = match.groups()
+            satisfied = lambda version, pinned=pinned, **_: pinned is None or version == pinned
+
+        try:
+            version = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            unsatisfied.append(line)
+            continue
+        if not satisfied(version, prereleases=True):
+            unsatisfied.append(line)
+    return unsatisfied
+
+def write_deps_sentinel(req_mtime: float) -> None:
+    """Record that requirements.txt as of `req_mtime` is installed for this interpreter."""
+    try:
+        with DEPS_SENTINEL.open('w') as f:
+            json.dump({"mtime": req_mtime, "python": sys.executable}, f)
+    except OSError:
+        pass  # Only costs a requirements check on the next run
+
 def install_from_requirements() -> bool:
     """
     Install all dependencies from requirements.txt file.
@@ -133,6 +254,10 @@ def install_from_requirements() -> bool:
 
     Note:
         - Looks for requirements.txt in the current directory
+        - Skips pip when DEPS_SENTINEL records an install of this
+          requirements.txt (same or newer mtime) for this interpreter
+        - Otherwise checks installed versions first and runs pip only for
+          the unsatisfied requirements (see find_unsatisfied_requirements)
         - Installs silently (stdout/stderr to DEVNULL)
         - Falls back to manual installation if this fails
         - Returns False if requirements.txt doesn't exist
@@ -145,11 +270,29 @@ def install_from_requirements() -> bool:
     """
     requirements_file = Path("requirements.txt")
     if requirements_file.exists():
+        req_mtime = requirements_file.stat().st_mtime
+        try:
+            with DEPS_SENTINEL.open() as f:
+                sentinel = json.load(f)
+            if sentinel["python"] == sys.executable and sentinel["mtime"] >= req_mtime:
+                print("✔ Dependencies from requirements.txt already installed.")
+                return True
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # No usable sentinel: check the installed packages
+
+        unsatisfied = find_unsatisfied_requirements(requirements_file)
+        if unsatisfied == []:
+            print("✔ Dependencies from requirements.txt already installed.")
+            write_deps_sentinel(req_mtime)
+            return True
+        pip_args = unsatisfied if unsatisfied is not None else ['-r', str(requirements_file)]
+
         try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', str(requirements_file)],
+            subprocess.check_call([sys.executable, '-m', 'pip', 'install', *pip_args],
                                   stdout=subprocess.DEVNULL,
                                   stderr=subprocess.DEVNULL)
             print("✔ All dependencies installed from requirements.txt.")
+            write_deps_sentinel(req_mtime)
             return True
         except subprocess.CalledProcessError:
             print("✘ Failed to install from requirements.txt. Falling back to manual installation.")
@@ -169,6 +312,7 @@ def check_standard_libraries() -> None:
 
     Note:
         - Non-critical check (only displays warning)
+        - Modules are located with find_spec(), not imported
         - Does not install missing libraries
         - Silent if all libraries are present
         - Can be removed if unnecessary
@@ -177,12 +321,7 @@ def check_standard_libraries() -> None:
         ⚠ Missing standard libraries: configparser, itertools
     """
     # Optional: Can be silenced or removed entirely
-    missing = []
-    for lib in standard_libraries:
-        try:
-            __import__(lib)
-        except ImportError:
-            missing.append(lib)
+    missing = find_missing_modules(standard_libraries)
     if missing:
         print(f"⚠ Missing standard libraries: {', '.join(missing)}")
     # Otherwise silent
@@ -191,7 +330,7 @@ def check_and_install_optional_libraries() -> None:
     """
     Check and install optional Python libraries.
 
-    Checks each optional library and installs it if missing. This function
+    Checks all optional libraries and installs the missing ones. This function
     is called as a fallback when requirements.txt installation fails or is
     not available.
 
@@ -203,23 +342,18 @@ def check_and_install_optional_libraries() -> None:
 
     Note:
         - Only called if requirements.txt installation fails
-        - Installs packages one by one
-        - Does not halt on individual package failure
+        - Libraries are located with find_spec(), not imported
+        - All missing packages are installed with one pip invocation
         - Prints summary message if all already installed
 
     Example Output:
-        ✔ Installed missing library: prettytable
-        ✔ Installed missing library: tqdm
+        ✔ Installed missing libraries: prettytable, tqdm
         ✔ All optional libraries are already installed.
     """
-    installed_something = False
-    for package in optional_libraries:
-        try:
-            __import__(package)
-        except ImportError:
-            install_package(package)
-            installed_something = True
-    if not installed_something:
+    missing = find_missing_modules(optional_libraries)
+    if missing:
+        install_packages(missing)
+    else:
         print("✔ All optional libraries are already installed.")
 
 def get_user_config() -> None:
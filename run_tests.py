@@ -22,14 +22,36 @@ Usage:
     # Run with coverage report
     python3 run_tests.py --coverage
 
+    # Re-run only the tests that failed last time
+    python3 run_tests.py --fast
+
+    # Run on 4 worker processes (default: one per CPU with pytest-xdist)
+    python3 run_tests.py --jobs 4
+
+    # Re-run the tests in one process whenever a .py file changes
+    python3 run_tests.py --watch
+
 Requirements:
     pip install pytest pytest-cov pytest-mock
+
+Optional:
+    pip install pytest-xdist  # Run tests in parallel
+    pip install watchdog      # --watch mode
 """
 
+import os
 import sys
+import time
 import argparse
 import subprocess
+import importlib.util
 from pathlib import Path
+from typing import Optional
+
+
+WATCH_DEBOUNCE = 0.2  # Seconds without file changes before a --watch re-run
+# Project packages reloaded before each --watch re-run, besides modules at the repo root
+WATCH_RELOAD_PACKAGES = ("lokalise_translation_manager", "tests")
 
 
 class TestRunner:
@@ -39,16 +61,22 @@ class TestRunner:
     Handles test execution, coverage reporting, and result formatting.
     """
 
-    def __init__(self, verbose: bool = False, coverage: bool = False):
+    def __init__(self, verbose: bool = False, coverage: bool = False, fast: bool = False,
+                 jobs: Optional[str] = None):
         """
         Initialize the test runner
 
         Args:
             verbose: Enable verbose output
             coverage: Enable coverage reporting
+            fast: Re-run only the tests that failed in the previous run
+            jobs: pytest-xdist worker count ("auto" if None, "0" to run serially)
         """
         self.verbose = verbose
         self.coverage = coverage
+        self.fast = fast
+        self.jobs = jobs
+        self.parallel = importlib.util.find_spec("xdist") is not None
         self.base_dir = Path(__file__).parent
         self.tests_dir = self.base_dir / "tests"
 
@@ -97,12 +125,89 @@ class TestRunner:
         cmd = self._build_pytest_command("tests/integration/")
         return self._execute_command(cmd)
 
-    def _build_pytest_command(self, path: str) -> list:
+    def run_watch(self, path: str) -> int:
+        """
+        Run tests in this process and re-run them whenever a .py file changes
+
+        pytest and the other third-party imports are loaded once and stay
+        warm between runs; the project's own modules are dropped from
+        sys.modules before each run so that edits are picked up.
+        Stop with Ctrl+C.
+
+        Args:
+            path: Path to test directory or file
+
+        Returns:
+            Exit code of the last run
+        """
+        try:
+            import pytest
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            print("\n❌ ERROR: --watch requires watchdog!")
+            print("Please install it: pip install watchdog")
+            return 1
+
+        last_change = [None]  # Time of the newest change not yet tested
+
+        class ChangeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = [event.src_path, getattr(event, "dest_path", "")]
+                if any(str(p).endswith(".py") for p in paths):
+                    last_change[0] = time.monotonic()
+
+        os.chdir(self.base_dir)
+        # No xdist workers: they would be fresh interpreters on every run,
+        # which is what watch mode exists to avoid
+        args = self._build_pytest_command(path, parallel=False)[3:]  # Drop "python -m pytest"
+
+        observer = Observer()
+        observer.schedule(ChangeHandler(), str(self.base_dir), recursive=True)
+        observer.start()
+        exit_code = 0
+        try:
+            while True:
+                self._unload_project_modules()
+                exit_code = int(pytest.main(args))
+                print(f"\n👀 Watching {self.base_dir} for changes (Ctrl+C to stop)...")
+
+                last_change[0] = None
+                while last_change[0] is None or time.monotonic() - last_change[0] < WATCH_DEBOUNCE:
+                    time.sleep(WATCH_DEBOUNCE / 4)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            observer.stop()
+            observer.join()
+
+        return exit_code
+
+    def _unload_project_modules(self) -> None:
+        """
+        Remove the project's modules from sys.modules
+
+        Only modules in WATCH_RELOAD_PACKAGES or directly at the repo root
+        are removed. Anything else under the repo, such as a local .venv
+        holding pytest and watchdog, stays loaded.
+        """
+        base_dir = self.base_dir.resolve()
+        reload_dirs = tuple(str(base_dir / package) + os.sep for package in WATCH_RELOAD_PACKAGES)
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if name == "__main__" or not module_file:
+                continue
+            module_file = os.path.abspath(module_file)
+            if module_file.startswith(reload_dirs) or os.path.dirname(module_file) == str(base_dir):
+                del sys.modules[name]
+
+    def _build_pytest_command(self, path: str, parallel: bool = True) -> list:
         """
         Build the pytest command with appropriate flags
 
         Args:
             path: Path to test directory or file
+            parallel: Distribute tests over pytest-xdist workers, if installed
 
         Returns:
             Command as list of strings
@@ -121,6 +226,16 @@ class TestRunner:
                 "--cov-report=term"
             ])
 
+        if parallel and self.parallel:
+            # loadfile keeps each module's tests, and so its fixtures, on
+            # one worker
+            cmd.extend(["-n", self.jobs or "auto", "--dist=loadfile"])
+
+        if self.fast:
+            # pytest's cache remembers last run's failures; with none
+            # recorded, fall back to the whole suite
+            cmd.extend(["--lf", "--last-failed-no-failures=all"])
+
         # Add useful pytest options
         cmd.extend([
             "--tb=short",  # Shorter traceback format
@@ -173,6 +288,10 @@ class TestRunner:
             print("\nInstall with: pip install " + " ".join(missing))
             return False
 
+        if not self.parallel:
+            print("ℹ️  pytest-xdist not installed, running tests serially "
+                  "(pip install pytest-xdist to run them in parallel)")
+
         return True
 
 
@@ -188,6 +307,9 @@ Examples:
   python3 run_tests.py --integration      # Run only integration tests
   python3 run_tests.py --verbose          # Verbose output
   python3 run_tests.py --coverage         # Generate coverage report
+  python3 run_tests.py --fast             # Re-run last failures only
+  python3 run_tests.py --jobs 4           # Run on 4 workers (needs pytest-xdist)
+  python3 run_tests.py --watch            # Re-run on changes (needs watchdog)
         """
     )
 
@@ -211,18 +333,37 @@ Examples:
         action="store_true",
         help="Generate coverage report"
     )
+    parser.add_argument(
+        "-f", "--fast",
+        action="store_true",
+        help="Re-run only the tests that failed last time (all if none did)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        metavar="N",
+        help="Number of pytest-xdist workers (default: auto, 0 to run serially)"
+    )
+    parser.add_argument(
+        "-w", "--watch",
+        action="store_true",
+        help="Keep running and re-run the tests whenever a .py file changes"
+    )
 
     args = parser.parse_args()
 
     # Initialize test runner
-    runner = TestRunner(verbose=args.verbose, coverage=args.coverage)
+    runner = TestRunner(verbose=args.verbose, coverage=args.coverage, fast=args.fast,
+                        jobs=args.jobs)
 
     # Check dependencies
     if not runner.check_dependencies():
         return 1
 
     # Run requested tests
-    if args.unit:
+    if args.watch:
+        path = "tests/unit/" if args.unit else "tests/integration/" if args.integration else "tests/"
+        return runner.run_watch(path)
+    elif args.unit:
         exit_code = runner.run_unit_tests()
     elif args.integration:
         exit_code = runner.run_integration_tests()
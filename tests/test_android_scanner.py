@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the Android scanner's strings.xml parsing and translation comparison.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from lokalise_translation_manager.scanner import android_scanner
+
+
+STRINGS_XML = """<?xml version="1.0" encoding="utf-8"?>
+<resources>
+{}
+</resources>
+"""
+
+
+def write_strings(directory: Path, *entries: str) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "strings.xml"
+    path.write_text(STRINGS_XML.format("\n".join(entries)), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def scanner(tmp_path, monkeypatch):
+    """android_scanner with its reports and excluded locales in tmp_path."""
+    reports_dir = tmp_path / "reports"
+    reports_dir.mkdir()
+    monkeypatch.setattr(android_scanner, "REPORTS_DIR", reports_dir)
+    monkeypatch.setattr(android_scanner, "MISSING_TRANSLATIONS_CSV", reports_dir / "missing.csv")
+    monkeypatch.setattr(android_scanner, "EXCLUDED_LOCALES_PATH", tmp_path / "excluded_locales.ini")
+    return android_scanner
+
+
+def test_parse_skips_non_translatable_strings(scanner, tmp_path):
+    path = write_strings(
+        tmp_path / "values",
+        '<string name="title">Title</string>',
+        '<string name="empty"></string>',
+        '<string name="styled">Hello <b>World</b></string>',
+        '<string name="app_name" translatable="false">My App</string>',
+    )
+
+    assert scanner.load_strings_file(str(path)) == {
+        "title": True,
+        "empty": False,
+        "styled": True,
+    }
+
+
+def test_non_translatable_strings_are_not_reported_missing(scanner, tmp_path):
+    values_dir = tmp_path / "lokalise"
+    project_dir = tmp_path / "project"
+    write_strings(
+        values_dir / "values",
+        '<string name="key_1">One</string>',
+        '<string name="key_2">Two</string>',
+        '<string name="key_3" translatable="false">https://example.com</string>',
+    )
+    for lang in ("de", "fr"):
+        write_strings(values_dir / f"values-{lang}", '<string name="key_1">1</string>')
+        write_strings(project_dir / "app" / "src" / "main" / "res" / f"values-{lang}")
+
+    missing = scanner.compare_translations(
+        str(values_dir), str(project_dir), {"key_1", "key_2", "key_3"}
+    )
+
+    assert {key: sorted(langs) for key, langs in missing.items()} == {"key_2": ["de", "fr"]}
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the source file scanning shared by the iOS and Android scanners.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from lokalise_translation_manager.scanner import _scan_common, android_scanner, ios_scanner
+
+
+def write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def android_project(tmp_path):
+    """A small Android project tree with Kotlin, Java and layout files."""
+    write(tmp_path / "app" / "Main.kt",
+          "getString(R.string.title)\ngetString(R.string.title)\nR.string.ok\n")
+    write(tmp_path / "app" / "Legacy.java", "setText(R.string.cancel);\n")
+    write(tmp_path / "app" / "res" / "layout" / "main.xml",
+          '<TextView android:text="@string/title" tools:text="R.string.ignored"/>\n')
+    write(tmp_path / "app" / "notes.txt", "R.string.not_scanned\n")
+    return tmp_path
+
+
+EXPECTED_ANDROID_KEYS = {"title", "ok", "cancel"}
+EXPECTED_ANDROID_FILES = {
+    str(Path("app", "Main.kt")): 3,
+    str(Path("app", "Legacy.java")): 1,
+    str(Path("app", "res", "layout", "main.xml")): 1,
+}
+
+
+def scan(directory, patterns, label="source files"):
+    errors = []
+    keys, files = _scan_common.scan_source_files(str(directory), patterns, label, errors.append)
+    return keys, files, errors
+
+
+def test_scan_picks_the_pattern_by_suffix(android_project):
+    keys, files, errors = scan(android_project, android_scanner.KEY_PATTERNS)
+
+    assert keys == EXPECTED_ANDROID_KEYS
+    assert files == EXPECTED_ANDROID_FILES
+    assert errors == []
+
+
+def test_ios_patterns_scan_swift_files_only(tmp_path):
+    write(tmp_path / "Views" / "Home.swift",
+          'NSLocalizedString("home.title", comment: "")\nNSLocalizedString(key, comment: "")\n')
+    write(tmp_path / "README.md", 'NSLocalizedString("not.scanned", comment: "")\n')
+
+    keys, files, _ = scan(tmp_path, ios_scanner.KEY_PATTERNS, "Swift files")
+
+    assert keys == {"home.title"}
+    assert files == {str(Path("Views", "Home.swift")): 1}
+
+
+def test_unreadable_files_are_reported_and_skipped(android_project, monkeypatch):
+    broken = android_project / "app" / "Broken.kt"
+    write(broken, "R.string.lost\n")
+    real_open = open
+
+    def failing_open(file, *args, **kwargs):
+        if str(file) == str(broken):
+            raise PermissionError("denied")
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", failing_open)
+    keys, files, errors = scan(android_project, android_scanner.KEY_PATTERNS)
+
+    assert keys == EXPECTED_ANDROID_KEYS
+    assert str(Path("app", "Broken.kt")) not in files
+    assert errors == [f"Error reading {broken}: denied"]
+
+
+def test_large_projects_are_scanned_in_a_process_pool(android_project, monkeypatch):
+    pools = []
+
+    class RecordingPool(_scan_common.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(_scan_common, "ProcessPoolExecutor", RecordingPool)
+    monkeypatch.setattr(_scan_common, "SCAN_WORKERS", 2)
+    monkeypatch.setattr(_scan_common, "PARALLEL_SCAN_MIN_FILES", 1)
+
+    keys, files, errors = scan(android_project, android_scanner.KEY_PATTERNS)
+
+    assert len(pools) == 1
+    assert pools[0]["mp_context"].get_start_method() == "spawn"
+    assert keys == EXPECTED_ANDROID_KEYS
+    assert files == EXPECTED_ANDROID_FILES
+    assert errors == []
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Tests for uploading translations to Lokalise (utils/upload_translations.py).
+
+HTTP requests go to a session backed by MockLokaliseAPI, so uploads update
+the mock's in-memory translations instead of a real project.
+"""
+
+import csv
+import json
+import re
+import sys
+import threading
+from concurrent.futures import Executor, Future
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+pytest.importorskip("requests")
+
+from lokalise_translation_manager.utils import upload_translations
+from tests.mocks import MockLokaliseAPI
+
+
+MODIFIED_AT = "2024-01-15 10:30:00 (Etc/UTC)"
+# Answers to a PUT that still fails after all of _send_put()'s re-sends
+SERVER_ERRORS = [(500, {"Retry-After": "0"})] * (upload_translations.MAX_RETRIES + 1)
+
+TRANSLATION_DONE = """key_name,key_id,languages,translation_id,translated
+ms_test_key_1,123,"it,de","457,458","Ciao!|Hallo"
+ms_test_key_2,124,"it,de","460,461","Arrivederci|Tschüss"
+ms_softpos_test,125,el,463,Soft POS
+"""
+
+
+class MockResponse:
+    """The parts of requests.Response that the upload reads"""
+
+    def __init__(self, status_code: int, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = json.dumps(body or {}).encode("utf-8")
+
+
+class MockLokaliseSession:
+    """
+    Stand-in for the upload's requests.Session, answering from MockLokaliseAPI
+
+    Args:
+        api: Mock API whose translations the PUTs update
+        project_status: Status code of the project check (GET)
+        scripted: {translation_id: [(status_code, headers), ...]} answers
+                  returned, in order, before the mock API is used
+    """
+
+    def __init__(self, api: MockLokaliseAPI, project_status: int = 200, scripted=None):
+        self.api = api
+        self.project_status = project_status
+        self.scripted = scripted or {}
+        self.gets = []
+        self.puts = []
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        self.gets.append(url)
+        return MockResponse(self.project_status, {"project_id": url.rsplit("/", 1)[1]})
+
+    def put(self, url, data):
+        trans_id = url.rsplit("/", 1)[1]
+        with self._lock:
+            self.puts.append(trans_id)
+            scripted = self.scripted.get(trans_id)
+            if scripted:
+                status_code, headers = scripted.pop(0)
+                return MockResponse(status_code, {"error": {"code": status_code}}, headers)
+
+        try:
+            self.api.update_translation("project", trans_id, json.loads(data)["translation"])
+        except Exception:
+            return MockResponse(404, {"error": {"code": 404, "message": "Not Found"}})
+        return MockResponse(200, {"translation": {"translation_id": trans_id, "modified_at": MODIFIED_AT}})
+
+
+@pytest.fixture
+def upload(tmp_path, monkeypatch):
+    """
+    Run update_translations() against a MockLokaliseSession.
+
+    Returns a function taking the translation_done.csv content (None reruns
+    the file already written) and session options, which returns the session
+    used.
+    """
+    reports_dir = tmp_path / "reports"
+    monkeypatch.setattr(upload_translations, "REPORTS_DIR", reports_dir)
+    monkeypatch.setattr(upload_translations, "TRANSLATION_DONE_FILE", reports_dir / "translation_done.csv")
+    monkeypatch.setattr(upload_translations, "FINAL_REPORT_FILE", reports_dir / "final_report.csv")
+    monkeypatch.setattr(upload_translations, "FAILED_UPDATE_FILE", reports_dir / "failed_update.csv")
+    monkeypatch.setattr(upload_translations, "UPLOAD_CACHE_FILE", reports_dir / ".upload_cache.sqlite3")
+    # Keep the tests fast; RateLimiter and _send_put() are otherwise unchanged
+    monkeypatch.setattr(upload_translations, "RATE_LIMIT", 1000)
+    monkeypatch.setattr(upload_translations, "RETRY_BACKOFF", 0)
+    api = MockLokaliseAPI()
+
+    def run(content: str = TRANSLATION_DONE, **session_options) -> MockLokaliseSession:
+        reports_dir.mkdir(exist_ok=True)
+        if content is not None:
+            upload_translations.TRANSLATION_DONE_FILE.write_text(content, encoding="utf-8")
+        session = MockLokaliseSession(api, **session_options)
+        monkeypatch.setattr(upload_translations, "get_session", lambda api_key: session)
+        upload_translations.update_translations("project", "token")
+        return session
+
+    run.api = api
+    return run
+
+
+def read_report(path: Path) -> list:
+    with path.open(encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def summary_count(output: str, label: str) -> int:
+    """Return a count from the UPLOAD SUMMARY table (tabulate or plain text)."""
+    return int(re.search(rf"{re.escape(label)}\W+(\d+)", output).group(1))
+
+
+def test_upload_reports_translations_in_input_order(upload, capsys):
+    session = upload()
+    output = capsys.readouterr().out
+
+    report = read_report(upload_translations.FINAL_REPORT_FILE)
+    assert [(row["key_name"], row["language_iso"], row["translation_id"], row["new_translation"])
+            for row in report] == [
+        ("ms_test_key_1", "it", "457", "Ciao!"),
+        ("ms_test_key_1", "de", "458", "Hallo"),
+        ("ms_test_key_2", "it", "460", "Arrivederci"),
+        ("ms_test_key_2", "de", "461", "Tschüss"),
+        ("ms_softpos_test", "el", "463", "Soft POS"),
+    ]
+    assert {row["modified_at"] for row in report} == {MODIFIED_AT}
+    assert not upload_translations.FAILED_UPDATE_FILE.exists()
+
+    assert sorted(session.puts) == ["457", "458", "460", "461", "463"]
+    assert upload.api.keys["124"]["translations"]["de"]["translation"] == "Tschüss"
+    assert summary_count(output, "Total API Requests") == 6  # Project check + 5 PUTs
+    assert summary_count(output, "Successful Updates") == 5
+    assert summary_count(output, "Failed/Skipped Updates") == 0
+
+
+def test_failed_and_invalid_rows_go_to_failed_report(upload, capsys):
+    upload(
+        "key_name,key_id,languages,translation_id,translated\n"
+        'ms_test_key_1,123,"it,de","457,999","Ciao!|Hallo"\n'
+        'ms_test_key_2,124,"it,de","460","Arrivederci|Tschüss"\n'
+        'ms_softpos_test,125,el,,Soft POS\n'
+    )
+    output = capsys.readouterr().out
+
+    assert [row["translation_id"] for row in read_report(upload_translations.FINAL_REPORT_FILE)] == ["457"]
+    failed = read_report(upload_translations.FAILED_UPDATE_FILE)
+    assert [(row["translation_id"], row["status_code"]) for row in failed] == [("999", "404")]
+    assert "FATAL DATA MISMATCH for key 'ms_test_key_2'" in output
+    # 1 unknown ID + 2 mismatched cells + 1 missing ID
+    assert summary_count(output, "Failed/Skipped Updates") == 4
+
+
+def test_rate_limited_upload_is_resent(upload, capsys):
+    session = upload(scripted={"458": [(429, {"Retry-After": "0"}), (429, {"Retry-After": "0"})]})
+    output = capsys.readouterr().out
+
+    assert session.puts.count("458") == 3
+    assert upload.api.keys["123"]["translations"]["de"]["translation"] == "Hallo"
+    assert summary_count(output, "Total API Requests") == 8  # Project check + 5 PUTs + 2 re-sends
+    assert summary_count(output, "Successful Updates") == 5
+
+
+def test_rate_limit_retries_are_bounded(upload, capsys):
+    retries = upload_translations.MAX_RATE_LIMIT_RETRIES
+    session = upload(scripted={"458": [(429, {"Retry-After": "0"})] * (retries + 1)})
+    capsys.readouterr()
+
+    assert session.puts.count("458") == retries + 1
+    failed = read_report(upload_translations.FAILED_UPDATE_FILE)
+    assert [(row["translation_id"], row["status_code"]) for row in failed] == [("458", "429")]
+
+
+def test_rejected_token_aborts_before_uploading(upload, capsys):
+    session = upload(project_status=401)
+    output = capsys.readouterr().out
+
+    assert "Authentication failed (401)" in output
+    assert session.puts == []
+    assert not upload_translations.FINAL_REPORT_FILE.exists()
+
+
+def test_unknown_project_aborts_before_uploading(upload, capsys):
+    session = upload(project_status=404)
+
+    assert "Lokalise project not found (404)" in capsys.readouterr().out
+    assert session.puts == []
+
+
+@pytest.mark.parametrize("content", ["", "key_name,key_id,languages,translation_id,translated\n"])
+def test_empty_input_exits_before_any_request(upload, capsys, content):
+    session = upload(content, project_status=401)
+
+    assert "is empty. Nothing to upload." in capsys.readouterr().out
+    assert session.gets == []
+    assert not upload_translations.UPLOAD_CACHE_FILE.exists()
+
+
+def test_token_rejected_during_upload_aborts(upload, capsys):
+    upload(scripted={"457": [(401, {})]})
+    output = capsys.readouterr().out
+
+    assert "Authentication failed (401)" in output
+    assert "UPLOAD SUMMARY" not in output
+
+
+def test_repeated_translation_id_uploads_last_text(upload, capsys):
+    session = upload(
+        "key_name,key_id,languages,translation_id,translated\n"
+        'ms_test_key_1,123,"it,de","457,458","Ciao!|Hallo"\n'
+        "ms_test_key_1,123,it,457,Salve\n"
+        "ms_test_key_1,123,de,458,Hallo\n"
+    )
+    output = capsys.readouterr().out
+
+    assert sorted(session.puts) == ["457", "458"]
+    assert upload.api.keys["123"]["translations"]["it"]["translation"] == "Salve"
+    assert summary_count(output, "Duplicates Skipped") == 2
+
+
+def test_rerun_of_same_input_skips_uploaded_translations(upload, capsys):
+    upload(scripted={"458": list(SERVER_ERRORS)})
+    assert upload_translations.UPLOAD_CACHE_FILE.exists()
+    capsys.readouterr()
+
+    session = upload(None)
+    output = capsys.readouterr().out
+
+    assert session.puts == ["458"]
+    assert summary_count(output, "Skipped (Already Uploaded)") == 4
+    assert len(read_report(upload_translations.FINAL_REPORT_FILE)) == 5
+    # A run without failures leaves nothing to resume
+    assert not upload_translations.UPLOAD_CACHE_FILE.exists()
+
+
+def test_cache_is_dropped_when_only_permanent_failures_remain(upload, capsys):
+    upload(TRANSLATION_DONE.replace('"457,458"', '"457,999"'))
+    capsys.readouterr()
+
+    assert read_report(upload_translations.FAILED_UPDATE_FILE)[0]["status_code"] == "404"
+    assert not upload_translations.UPLOAD_CACHE_FILE.exists()
+
+
+def test_main_ignores_the_callers_argv(monkeypatch):
+    calls = []
+    monkeypatch.setattr(sys, "argv", ["run.py", "--no-cache"])
+    monkeypatch.setattr(upload_translations, "load_lokalise_config", lambda: ("project", "token"))
+    monkeypatch.setattr(upload_translations, "update_translations",
+                        lambda project_id, api_key, use_cache: calls.append(use_cache))
+
+    upload_translations.main()
+    upload_translations.main(use_cache=False)
+
+    assert calls == [True, False]
+
+
+def test_new_input_is_not_skipped_by_cache(upload, capsys):
+    upload(scripted={"458": list(SERVER_ERRORS)})
+
+    session = upload(TRANSLATION_DONE.replace("Ciao!", "Ciao"))
+    capsys.readouterr()
+
+    assert sorted(session.puts) == ["457", "458", "460", "461", "463"]
+
+
+class ImmediateExecutor(Executor):
+    """Executor that runs the first `run_first` calls on submit and leaves the rest queued."""
+
+    def __init__(self, run_first: int):
+        self.run_first = run_first
+        self.futures = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        if len(self.futures) < self.run_first:
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+        self.futures.append(future)
+        return future
+
+
+def test_map_bounded_keeps_order_and_window():
+    consumed = []
+
+    def items():
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    executor = ImmediateExecutor(run_first=10)
+    results = upload_translations._map_bounded(executor, lambda i: i * 2, items(), window=3)
+
+    assert next(results) == 0
+    assert consumed == [0, 1, 2]  # Only the window is read ahead
+    assert list(results) == [2 * i for i in range(1, 10)]
+
+
+def test_map_bounded_cancels_queued_calls_when_one_raises():
+    def fail(i):
+        raise RuntimeError("Authentication failed (401)")
+
+    executor = ImmediateExecutor(run_first=1)
+    with pytest.raises(RuntimeError):
+        list(upload_translations._map_bounded(executor, fail, range(10), window=4))
+
+    assert len(executor.futures) == 4
+    assert all(future.cancelled() for future in executor.futures[1:])
+
+
+def test_server_errors_are_resent_within_the_rate_limit(upload, capsys, monkeypatch):
+    pauses = []
+    pause = upload_translations.RateLimiter.pause
+    monkeypatch.setattr(upload_translations.RateLimiter, "pause",
+                        lambda self, seconds: (pauses.append(seconds), pause(self, seconds)))
+    session = upload(scripted={"458": [(503, {"Retry-After": "0"}), (502, {})]})
+    output = capsys.readouterr().out
+
+    assert session.puts.count("458") == 3
+    assert len(pauses) == 2
+    assert summary_count(output, "Total API Requests") == 8  # Project check + 5 PUTs + 2 re-sends
+    assert summary_count(output, "Successful Updates") == 5
+
+
+def test_server_error_retries_are_bounded(upload, capsys):
+    session = upload(scripted={"458": list(SERVER_ERRORS)})
+    capsys.readouterr()
+
+    assert session.puts.count("458") == upload_translations.MAX_RETRIES + 1
+    failed = read_report(upload_translations.FAILED_UPDATE_FILE)
+    assert [(row["translation_id"], row["status_code"]) for row in failed] == [("458", "500")]
+
+
+def test_session_adapter_does_not_retry(monkeypatch):
+    monkeypatch.setattr(upload_translations, "_SESSION", None)
+    session = upload_translations.get_session("token")
+    retries = session.get_adapter("https://api.lokalise.com").max_retries
+
+    for status_code in (429, *upload_translations.RETRY_STATUSES):
+        assert not retries.is_retry("PUT", status_code, has_retry_after=True)
+    assert session.headers["X-Api-Token"] == "token"